@@ -3,12 +3,21 @@ from .proposal_analyzer import ProposalAnalyzer
 from .risk_assessor import RiskAssessor
 from .fraud_detector import FraudDetector
 from .sentiment_analyzer import SentimentAnalyzer
+from .pipeline import AnalysisPipeline
+from .rules import RuleSnapshot, RuleStore
+from .vote_sentiment import VoteSentimentAggregator
+from .impact_simulator import ImpactSimulator
 
 __all__ = [
     'BaseAgent',
     'ProposalAnalyzer',
     'RiskAssessor',
     'FraudDetector',
-    'SentimentAnalyzer'
+    'SentimentAnalyzer',
+    'AnalysisPipeline',
+    'RuleSnapshot',
+    'RuleStore',
+    'VoteSentimentAggregator',
+    'ImpactSimulator'
 ]
 
@@ -1,39 +1,30 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from .base_agent import BaseAgent
-import re
+from .rules import RuleSnapshot, RuleStore, get_rule_store
 
 class FraudDetector(BaseAgent):
     """
     Detect potential fraud indicators in proposals
     """
     
-    def __init__(self):
+    def __init__(self, rules: Optional[RuleStore] = None):
         super().__init__()
         
-        # Known fraud patterns
-        self.fraud_keywords = [
-            'guaranteed returns', 'no risk', 'get rich', 'double your money',
-            'limited offer', 'act now', 'send money', 'wire transfer',
-            'offshore account', 'tax haven', 'anonymous', 'untraceable',
-            'ponzi', 'pyramid', 'mlm', 'multi-level'
-        ]
-        
-        self.suspicious_patterns = [
-            r'(\d+)%\s*(profit|return|gain|roi)',  # Specific return percentages
-            r'(double|triple|10x)\s*(your|the)\s*(money|investment)',  # Unrealistic multipliers
-            r'(no|zero|minimal)\s*risk',  # No risk claims
-        ]
+        # Known fraud keywords and patterns come from the rules config (config/rules.json)
+        self.rules = rules or get_rule_store()
     
     async def detect(
         self,
         submitter: str,
         description: str,
-        requested_amount: float
+        requested_amount: float,
+        rules: Optional[RuleSnapshot] = None
     ) -> Dict[str, Any]:
         """
         Analyze proposal for fraud indicators
         """
         
+        rules = rules or self.rules.current()
         fraud_score = 0.0
         indicators = []
         
@@ -42,7 +33,7 @@ class FraudDetector(BaseAgent):
         # Check for fraud keywords
         keyword_count = 0
         found_keywords = []
-        for keyword in self.fraud_keywords:
+        for keyword in rules.fraud_keywords:
             if keyword in desc_lower:
                 keyword_count += 1
                 found_keywords.append(keyword)
@@ -54,8 +45,8 @@ class FraudDetector(BaseAgent):
         
         # Check for suspicious patterns
         pattern_count = 0
-        for pattern in self.suspicious_patterns:
-            if re.search(pattern, desc_lower):
+        for pattern in rules.suspicious_patterns:
+            if pattern.search(desc_lower):
                 pattern_count += 1
         
         if pattern_count > 0:
@@ -101,7 +92,8 @@ class FraudDetector(BaseAgent):
             "threat_level": threat_level,
             "status": status,
             "indicators": indicators if indicators else ["No significant fraud indicators detected"],
-            "model": self.get_model_name()
+            "model": self.get_model_name(),
+            "rules_version": rules.version
         }
     
     async def process(self, **kwargs):
@@ -0,0 +1,204 @@
+import os
+import time
+from typing import Dict, Any, List, Optional
+
+from .proposal_analyzer import ProposalAnalyzer
+from .risk_assessor import RiskAssessor
+from .fraud_detector import FraudDetector
+from .sentiment_analyzer import SentimentAnalyzer
+from .rules import RuleStore, get_rule_store
+
+# Analysis tiers, most to least expensive
+TIER_FULL = "full"          # LLM (when configured) + transformer sentiment
+TIER_REDUCED = "reduced"    # Rule-based recommendation + transformer sentiment
+TIER_MINIMAL = "minimal"    # Rule-based recommendation + keyword sentiment
+ANALYSIS_TIERS = [TIER_FULL, TIER_REDUCED, TIER_MINIMAL]
+
+# Expensive stages that early exit can skip
+STAGE_SENTIMENT_MODEL = "sentiment_model"
+
+
+class PipelineStats:
+    """Counts early exits and estimates model time saved from observed stage durations"""
+
+    def __init__(self, smoothing: float = 0.1):
+        self.smoothing = smoothing
+        self.runs = 0
+        self.early_exits = 0
+        self.stage_runs = {STAGE_SENTIMENT_MODEL: 0}
+        self.stage_skips = {STAGE_SENTIMENT_MODEL: 0}
+        self.stage_avg_ms = {STAGE_SENTIMENT_MODEL: 0.0}
+        self.saved_ms = {STAGE_SENTIMENT_MODEL: 0.0}
+
+    def observe(self, stage: str, elapsed_ms: float):
+        self.stage_runs[stage] += 1
+        if self.stage_runs[stage] == 1:
+            self.stage_avg_ms[stage] = elapsed_ms
+        else:
+            self.stage_avg_ms[stage] += self.smoothing * (elapsed_ms - self.stage_avg_ms[stage])
+
+    def skipped(self, stages: List[str]):
+        for stage in stages:
+            self.stage_skips[stage] += 1
+            self.saved_ms[stage] += self.stage_avg_ms[stage]
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "early_exits": self.early_exits,
+            "early_exit_rate": round(self.early_exits / self.runs, 4) if self.runs else 0.0,
+            "stages": {
+                stage: {
+                    "runs": self.stage_runs[stage],
+                    "skipped": self.stage_skips[stage],
+                    "avg_ms": round(self.stage_avg_ms[stage], 2),
+                    "estimated_saved_ms": round(self.saved_ms[stage], 2)
+                }
+                for stage in self.stage_runs
+            },
+            "estimated_saved_ms": round(sum(self.saved_ms.values()), 2)
+        }
+
+
+class AnalysisPipeline:
+    """
+    Runs the full agent chain for a single proposal.
+    Shared by the HTTP API and the bulk backfill CLI so both produce identical results.
+    """
+
+    def __init__(
+        self,
+        proposal_analyzer: Optional[ProposalAnalyzer] = None,
+        risk_assessor: Optional[RiskAssessor] = None,
+        fraud_detector: Optional[FraudDetector] = None,
+        sentiment_analyzer: Optional[SentimentAnalyzer] = None,
+        rules: Optional[RuleStore] = None,
+        early_exit: Optional[bool] = None
+    ):
+        self.proposal_analyzer = proposal_analyzer or ProposalAnalyzer()
+        self.risk_assessor = risk_assessor or RiskAssessor()
+        self.fraud_detector = fraud_detector or FraudDetector()
+        self.sentiment_analyzer = sentiment_analyzer or SentimentAnalyzer()
+        self.rules = rules or get_rule_store()
+        if early_exit is None:
+            early_exit = os.getenv("EARLY_EXIT_ENABLED", "true").lower() == "true"
+        self.early_exit = early_exit
+        self.stats = PipelineStats()
+
+    async def run(
+        self,
+        proposal_id: int,
+        title: str,
+        description: str,
+        proposal_type: str,
+        requested_amount: float,
+        submitter_address: str = "",
+        tier: str = TIER_FULL
+    ) -> Dict[str, Any]:
+        """
+        Run risk, fraud, sentiment and comprehensive analysis, cheapest stages first.
+        `tier` caps how expensive the run may be; the tier actually achieved
+        (lower if the LLM or transformer failed and fell back) is returned as analysis_tier.
+        Early exit: when the recommendation will be rule-based anyway (no LLM, or tier below
+        full) and risk or fraud is past the rules' decision cut-offs, the recommendation no
+        longer depends on sentiment, so the transformer is skipped (listed in skipped_stages)
+        and keyword sentiment is reported instead.
+        Returns a flat dict with the AnalysisResponse fields.
+        """
+
+        start_time = time.time()
+
+        # One snapshot for the whole request, so a concurrent reload can't mix rule versions
+        rules = self.rules.current()
+
+        risk_result = await self.risk_assessor.assess(
+            title=title,
+            description=description,
+            proposal_type=proposal_type,
+            requested_amount=requested_amount,
+            rules=rules
+        )
+
+        fraud_result = await self.fraud_detector.detect(
+            submitter=submitter_address,
+            description=description,
+            requested_amount=requested_amount,
+            rules=rules
+        )
+
+        use_model = tier != TIER_MINIMAL and self.sentiment_analyzer.sentiment_pipeline is not None
+        use_llm = tier == TIER_FULL
+
+        self.stats.runs += 1
+        early_exit_reason = None
+        skipped_stages = []
+        if self.early_exit and use_model and not self.proposal_analyzer.uses_llm(use_llm):
+            early_exit_reason = self.proposal_analyzer.settled_by_rules(
+                risk_result["score"], fraud_result["probability"], rules
+            )
+            if early_exit_reason:
+                skipped_stages.append(STAGE_SENTIMENT_MODEL)
+                use_model = False
+                self.stats.early_exits += 1
+                self.stats.skipped(skipped_stages)
+
+        stage_start = time.perf_counter()
+        sentiment_result = await self.sentiment_analyzer.analyze(
+            text=f"{title}. {description}",
+            use_model=use_model,
+            rules=rules
+        )
+        if sentiment_result.get("model") != "Keyword-Based":
+            self.stats.observe(STAGE_SENTIMENT_MODEL, (time.perf_counter() - stage_start) * 1000)
+
+        comprehensive_analysis = await self.proposal_analyzer.analyze(
+            proposal_id=proposal_id,
+            title=title,
+            description=description,
+            proposal_type=proposal_type,
+            requested_amount=requested_amount,
+            risk_score=risk_result["score"],
+            fraud_probability=fraud_result["probability"],
+            sentiment_score=sentiment_result["score"],
+            use_llm=use_llm,
+            rules=rules
+        )
+
+        processing_time = int((time.time() - start_time) * 1000)
+
+        return {
+            "proposal_id": proposal_id,
+            "risk_score": risk_result["score"],
+            "fraud_probability": fraud_result["probability"],
+            "sentiment_score": sentiment_result["score"],
+            "recommended_action": comprehensive_analysis["recommendation"],
+            "confidence_level": comprehensive_analysis["confidence"],
+            "key_insights": comprehensive_analysis["key_insights"],
+            "detailed_analysis": comprehensive_analysis["detailed_analysis"],
+            "model_used": comprehensive_analysis["model_used"],
+            "processing_time": processing_time,
+            "recommendation_method": comprehensive_analysis.get("method", "rules"),
+            # A settled rule-based outcome is what the admitted tier delivers, so early exits keep it
+            "analysis_tier": tier if early_exit_reason else self._achieved_tier(sentiment_result, comprehensive_analysis),
+            "rules_version": rules.version,
+            "community_sentiment_score": comprehensive_analysis.get("community_sentiment"),
+            "skipped_stages": skipped_stages,
+            "early_exit_reason": early_exit_reason
+        }
+
+    def sentiment_tier(self, sentiment_result: Dict[str, Any]) -> str:
+        """Tier a sentiment result was actually delivered at: minimal if the transformer exists but keywords were used"""
+        if self.sentiment_analyzer.sentiment_pipeline is not None and sentiment_result.get("model") == "Keyword-Based":
+            return TIER_MINIMAL
+        return TIER_FULL
+
+    def _achieved_tier(self, sentiment_result: Dict[str, Any], comprehensive_analysis: Dict[str, Any]) -> str:
+        """Tier actually delivered, relative to what this deployment has available"""
+        if self.sentiment_tier(sentiment_result) == TIER_MINIMAL:
+            return TIER_MINIMAL
+        if self.proposal_analyzer.llm is not None and comprehensive_analysis.get("method") == "rules":
+            return TIER_REDUCED
+        return TIER_FULL
+
+    async def process(self, **kwargs):
+        return await self.run(**kwargs)
@@ -1,6 +1,7 @@
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from .base_agent import BaseAgent
+from .rules import RuleSnapshot, RuleStore, get_rule_store
 
 try:
     from langchain_openai import ChatOpenAI
@@ -16,9 +17,14 @@ class ProposalAnalyzer(BaseAgent):
     to provide holistic recommendations
     """
     
-    def __init__(self):
+    def __init__(self, vote_sentiment=None, rules: Optional[RuleStore] = None):
         super().__init__()
         self.llm = None
+        # Optional VoteSentimentAggregator; when it has data for a proposal, the
+        # weighted sentiment of vote reasons is used as the community sentiment signal
+        self.vote_sentiment = vote_sentiment
+        # Decision cut-offs of the rule-based recommendation come from the rules config
+        self.rules = rules or get_rule_store()
         
         if LANGCHAIN_AVAILABLE and self.use_openai:
             try:
@@ -39,22 +45,55 @@ class ProposalAnalyzer(BaseAgent):
         requested_amount: float,
         risk_score: float,
         fraud_probability: float,
-        sentiment_score: float
+        sentiment_score: float,
+        use_llm: bool = True,
+        rules: Optional[RuleSnapshot] = None
     ) -> Dict[str, Any]:
         """
         Comprehensive analysis combining all signals
+        Set use_llm=False to force the cheap rule-based path (e.g. under load)
         """
         
-        if self.llm and LANGCHAIN_AVAILABLE:
-            return await self._analyze_with_llm(
+        rules = rules or self.rules.current()
+        community_sentiment = self.community_sentiment(proposal_id)
+        if community_sentiment is not None:
+            sentiment_score = community_sentiment
+        
+        if self.uses_llm(use_llm):
+            result = await self._analyze_with_llm(
                 title, description, proposal_type, requested_amount,
-                risk_score, fraud_probability, sentiment_score
+                risk_score, fraud_probability, sentiment_score, rules
             )
         else:
-            return self._analyze_with_rules(
+            result = self._analyze_with_rules(
                 title, description, proposal_type, requested_amount,
-                risk_score, fraud_probability, sentiment_score
+                risk_score, fraud_probability, sentiment_score, rules
             )
+        
+        result["community_sentiment"] = community_sentiment
+        return result
+    
+    def uses_llm(self, use_llm: bool = True) -> bool:
+        """Whether analyze() would ask the LLM; otherwise the recommendation is rule-based"""
+        return bool(use_llm and self.llm and LANGCHAIN_AVAILABLE)
+    
+    def settled_by_rules(self, risk_score: float, fraud_probability: float, rules: Optional[RuleSnapshot] = None) -> Optional[str]:
+        """
+        Reason the rule-based recommendation is already fixed by risk and fraud alone
+        (it no longer depends on sentiment), or None
+        """
+        rules = rules or self.rules.current()
+        if fraud_probability > rules.fraud_reject_threshold:
+            return f"Fraud probability {fraud_probability:.1f} above {rules.fraud_reject_threshold:g}: rule-based Reject"
+        if risk_score > rules.risk_review_threshold:
+            return f"Risk score {risk_score:.1f} above {rules.risk_review_threshold:g}: rule-based Review"
+        return None
+    
+    def community_sentiment(self, proposal_id: int) -> Optional[float]:
+        """Voting-power-weighted sentiment of vote reasons, if any were ingested (O(1))"""
+        if self.vote_sentiment is None:
+            return None
+        return self.vote_sentiment.current_score(proposal_id)
     
     async def _analyze_with_llm(
         self,
@@ -64,7 +103,8 @@ class ProposalAnalyzer(BaseAgent):
         requested_amount: float,
         risk_score: float,
         fraud_probability: float,
-        sentiment_score: float
+        sentiment_score: float,
+        rules: Optional[RuleSnapshot] = None
     ) -> Dict[str, Any]:
         """Use LLM for comprehensive analysis"""
         
@@ -123,7 +163,7 @@ DETAILED_ANALYSIS:
             # Fallback to rule-based
             return self._analyze_with_rules(
                 title, description, proposal_type, requested_amount,
-                risk_score, fraud_probability, sentiment_score
+                risk_score, fraud_probability, sentiment_score, rules
             )
     
     def _analyze_with_rules(
@@ -134,16 +174,19 @@ DETAILED_ANALYSIS:
         requested_amount: float,
         risk_score: float,
         fraud_probability: float,
-        sentiment_score: float
+        sentiment_score: float,
+        rules: Optional[RuleSnapshot] = None
     ) -> Dict[str, Any]:
         """Rule-based analysis when LLM is unavailable"""
         
-        # Calculate recommendation based on scores
-        if fraud_probability > 70:
+        rules = rules or self.rules.current()
+        
+        # Calculate recommendation based on scores (cut-offs shared with settled_by_rules)
+        if fraud_probability > rules.fraud_reject_threshold:
             recommendation = "Reject"
             confidence = 90
             key_insight = "High fraud probability detected"
-        elif risk_score > 80:
+        elif risk_score > rules.risk_review_threshold:
             recommendation = "Review"
             confidence = 75
             key_insight = "High risk score requires manual review"
@@ -185,7 +228,8 @@ This {proposal_type} proposal requests ${requested_amount:,.2f} in funding.
             "confidence": float(confidence),
             "key_insights": "\n".join(f"• {insight}" for insight in insights),
             "detailed_analysis": detailed,
-            "model_used": self.get_model_name()
+            "model_used": self.get_model_name(),
+            "method": "rules"
         }
     
     def _parse_llm_response(self, response: str) -> Dict[str, Any]:
@@ -222,7 +266,8 @@ This {proposal_type} proposal requests ${requested_amount:,.2f} in funding.
             "confidence": confidence,
             "key_insights": key_insights.strip() or "Analysis completed successfully",
             "detailed_analysis": detailed_analysis.strip() or "Comprehensive analysis performed based on available data.",
-            "model_used": self.get_model_name()
+            "model_used": self.get_model_name(),
+            "method": "llm"
         }
     
     async def process(self, **kwargs):
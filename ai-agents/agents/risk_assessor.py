@@ -1,55 +1,41 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from .base_agent import BaseAgent
-import re
+from .rules import RuleSnapshot, RuleStore, get_rule_store
 
 class RiskAssessor(BaseAgent):
     """
     Assess risk level of proposals based on multiple factors
     """
     
-    def __init__(self):
+    def __init__(self, rules: Optional[RuleStore] = None):
         super().__init__()
         
-        # Risk weight factors
-        self.amount_thresholds = {
-            1000: 10,      # Under $1k: +10 risk
-            10000: 25,     # $1k-$10k: +25 risk
-            100000: 50,    # $10k-$100k: +50 risk
-            float('inf'): 80  # Over $100k: +80 risk
-        }
-        
-        self.proposal_type_risk = {
-            "Treasury": 60,
-            "Technical": 45,
-            "Governance": 30,
-            "Climate": 35
-        }
+        # Amount bands, type weights and keywords come from the rules config (config/rules.json)
+        self.rules = rules or get_rule_store()
     
     async def assess(
         self,
         title: str,
         description: str,
         proposal_type: str,
-        requested_amount: float
+        requested_amount: float,
+        rules: Optional[RuleSnapshot] = None
     ) -> Dict[str, Any]:
         """
         Calculate risk score based on proposal characteristics
         """
         
+        rules = rules or self.rules.current()
         base_risk = 0.0
         factors = []
         
         # Factor 1: Requested amount
-        amount_risk = 0
-        for threshold, risk in self.amount_thresholds.items():
-            if requested_amount <= threshold:
-                amount_risk = risk
-                break
+        amount_risk = rules.amount_risk(requested_amount)
         base_risk += amount_risk * 0.4  # 40% weight
         factors.append(f"Amount risk: {amount_risk} (${requested_amount:,.2f})")
         
         # Factor 2: Proposal type
-        type_risk = self.proposal_type_risk.get(proposal_type, 50)
+        type_risk = rules.proposal_type_risk.get(proposal_type, rules.default_type_risk)
         base_risk += type_risk * 0.2  # 20% weight
         factors.append(f"Type risk: {type_risk} ({proposal_type})")
         
@@ -65,19 +51,14 @@ class RiskAssessor(BaseAgent):
         factors.append(f"Description risk: {desc_risk} ({desc_words} words)")
         
         # Factor 4: Suspicious keywords
-        suspicious_keywords = [
-            'urgent', 'immediately', 'emergency', 'guaranteed', 'profit',
-            'investment return', 'quick', 'limited time', 'exclusive'
-        ]
         desc_lower = description.lower()
-        suspicious_count = sum(1 for keyword in suspicious_keywords if keyword in desc_lower)
+        suspicious_count = sum(1 for keyword in rules.suspicious_keywords if keyword in desc_lower)
         keyword_risk = min(suspicious_count * 20, 80)
         base_risk += keyword_risk * 0.15  # 15% weight
         factors.append(f"Keyword risk: {keyword_risk} ({suspicious_count} suspicious terms)")
         
         # Factor 5: External links (potential phishing)
-        url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-        urls = re.findall(url_pattern, description)
+        urls = rules.url_pattern.findall(description)
         link_risk = min(len(urls) * 15, 60)
         base_risk += link_risk * 0.10  # 10% weight
         factors.append(f"Link risk: {link_risk} ({len(urls)} external links)")
@@ -97,7 +78,8 @@ class RiskAssessor(BaseAgent):
             "score": round(final_risk, 2),
             "level": risk_level,
             "factors": factors,
-            "model": self.get_model_name()
+            "model": self.get_model_name(),
+            "rules_version": rules.version
         }
     
     async def process(self, **kwargs):
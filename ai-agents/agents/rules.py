@@ -0,0 +1,197 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Pattern, Tuple
+
+DEFAULT_RULES_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config", "rules.json"
+)
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class RuleSnapshot:
+    """
+    Immutable, precompiled scoring rules.
+    Agents read one snapshot per request, so a reload never changes rules mid-analysis.
+    """
+
+    version: str  # "<declared version>+<content hash>", changes whenever any rule changes
+
+    # RiskAssessor
+    amount_limits: Tuple[float, ...]   # sorted ascending, last is inf
+    amount_risks: Tuple[int, ...]
+    proposal_type_risk: Mapping[str, int]
+    default_type_risk: int
+    suspicious_keywords: Tuple[str, ...]
+    url_pattern: Pattern
+
+    # FraudDetector
+    fraud_keywords: Tuple[str, ...]
+    suspicious_patterns: Tuple[Pattern, ...]
+
+    # SentimentAnalyzer
+    positive_words: Tuple[str, ...]
+    negative_words: Tuple[str, ...]
+
+    # ProposalAnalyzer rule-based recommendation: above these it always Rejects / asks for Review
+    fraud_reject_threshold: float
+    risk_review_threshold: float
+
+    def amount_risk(self, requested_amount: float) -> int:
+        """Risk of the first band whose limit is >= the requested amount"""
+        index = bisect_left(self.amount_limits, requested_amount)
+        return self.amount_risks[min(index, len(self.amount_risks) - 1)]
+
+
+def rules_version(raw: Dict[str, Any]) -> str:
+    """
+    Declared version plus a hash of the canonical document, so an edit that forgets to
+    bump "version" still gets a new version (and invalidates caches keyed on it)
+    """
+    canonical = json.dumps(raw, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:8]
+    return f"{raw['version']}+{digest}"
+
+
+def compile_rules(raw: Dict[str, Any]) -> RuleSnapshot:
+    """Validate a rules document and compile it into a RuleSnapshot (raises ValueError)"""
+    try:
+        risk = raw["risk"]
+        fraud = raw["fraud"]
+        sentiment = raw["sentiment"]
+        decision = raw.get("decision", {})
+
+        bands = sorted(
+            (float("inf") if band["max_amount"] is None else float(band["max_amount"]), int(band["risk"]))
+            for band in risk["amount_thresholds"]
+        )
+        if not bands or bands[-1][0] != float("inf"):
+            raise ValueError("amount_thresholds must end with an open band (max_amount: null)")
+
+        return RuleSnapshot(
+            version=rules_version(raw),
+            amount_limits=tuple(limit for limit, _ in bands),
+            amount_risks=tuple(risk_value for _, risk_value in bands),
+            proposal_type_risk=MappingProxyType({str(k): int(v) for k, v in risk["proposal_type_risk"].items()}),
+            default_type_risk=int(risk.get("default_type_risk", 50)),
+            suspicious_keywords=tuple(k.lower() for k in risk["suspicious_keywords"]),
+            url_pattern=re.compile(risk["url_pattern"]),
+            fraud_keywords=tuple(k.lower() for k in fraud["fraud_keywords"]),
+            suspicious_patterns=tuple(re.compile(p) for p in fraud["suspicious_patterns"]),
+            positive_words=tuple(w.lower() for w in sentiment["positive_words"]),
+            negative_words=tuple(w.lower() for w in sentiment["negative_words"]),
+            fraud_reject_threshold=float(decision.get("fraud_reject_threshold", 70)),
+            risk_review_threshold=float(decision.get("risk_review_threshold", 80))
+        )
+    except (KeyError, TypeError, AttributeError, re.error) as e:
+        raise ValueError(f"Invalid rules configuration: {e}")
+
+
+class RuleStore:
+    """
+    Holds the current RuleSnapshot and swaps it atomically on reload.
+    Readers never lock: they take a reference to whichever snapshot is current.
+    Listeners registered with on_reload() are called with each new snapshot.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.getenv("RULES_CONFIG_PATH", DEFAULT_RULES_PATH)
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._failed_mtime = None  # mtime of the last file version that failed to load
+        self._watcher = None
+        self._listeners: List[Callable[[RuleSnapshot], None]] = []
+        self._snapshot = self._load()
+
+    def current(self) -> RuleSnapshot:
+        return self._snapshot
+
+    @property
+    def version(self) -> str:
+        return self._snapshot.version
+
+    def _load(self) -> RuleSnapshot:
+        mtime = os.path.getmtime(self.path)
+        with open(self.path, "r", encoding="utf-8") as f:
+            snapshot = compile_rules(json.load(f))
+        self._mtime = mtime
+        return snapshot
+
+    def on_reload(self, listener: Callable[[RuleSnapshot], None]):
+        """Call listener(snapshot) after every successful reload (from the reloading thread)"""
+        self._listeners.append(listener)
+
+    def _current_mtime(self) -> float:
+        try:
+            return os.path.getmtime(self.path)
+        except OSError:
+            return -1.0  # missing file
+
+    def reload(self, force: bool = True) -> Dict[str, Any]:
+        """
+        Recompile the rules file and swap it in.
+        Without force, only reloads when the file changed, and skips a version that already failed.
+        A broken file keeps the current snapshot; the failure is logged once per file version.
+        """
+        with self._lock:
+            previous = self._snapshot.version
+            mtime = self._current_mtime()
+            if not force and mtime in (self._mtime, self._failed_mtime):
+                return {"reloaded": False, "version": previous}
+
+            try:
+                snapshot = self._load()
+            except (OSError, ValueError) as e:
+                if mtime != self._failed_mtime:
+                    logger.error("Rules file %s not reloaded, keeping version %s: %s", self.path, previous, e)
+                self._failed_mtime = mtime
+                return {"reloaded": False, "version": previous, "error": str(e)}
+
+            self._snapshot = snapshot
+            self._failed_mtime = None
+
+        logger.info("Rules reloaded: version %s -> %s", previous, snapshot.version)
+        for listener in self._listeners:
+            try:
+                listener(snapshot)
+            except Exception:
+                logger.exception("Rules reload listener failed")
+
+        return {"reloaded": True, "version": snapshot.version, "previous_version": previous}
+
+    def watch(self, interval: float = 5.0):
+        """Poll the rules file in a daemon thread and reload when it changes"""
+        if self._watcher is not None:
+            return
+
+        def _poll():
+            while not stop.wait(interval):
+                self.reload(force=False)
+
+        stop = threading.Event()
+        self._watcher = (threading.Thread(target=_poll, name="rules-watcher", daemon=True), stop)
+        self._watcher[0].start()
+
+    def stop_watching(self):
+        if self._watcher is not None:
+            self._watcher[1].set()
+            self._watcher = None
+
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+def get_rule_store() -> RuleStore:
+    """Process-wide rule store shared by all agents"""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = RuleStore()
+        return _default_store
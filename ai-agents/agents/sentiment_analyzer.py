@@ -1,5 +1,7 @@
-from typing import Dict, Any
+import asyncio
+from typing import Dict, Any, List, Optional, Tuple
 from .base_agent import BaseAgent
+from .rules import RuleSnapshot, RuleStore, get_rule_store
 
 try:
     from transformers import pipeline
@@ -12,7 +14,7 @@ class SentimentAnalyzer(BaseAgent):
     Analyze sentiment of proposal text using NLP
     """
     
-    def __init__(self):
+    def __init__(self, rules: Optional[RuleStore] = None):
         super().__init__()
         self.sentiment_pipeline = None
         
@@ -26,33 +28,28 @@ class SentimentAnalyzer(BaseAgent):
             except:
                 self.sentiment_pipeline = None
         
-        # Positive/negative word lists for fallback
-        self.positive_words = [
-            'benefit', 'improve', 'positive', 'growth', 'sustainable', 'community',
-            'transparent', 'innovative', 'solution', 'support', 'help', 'enhance',
-            'progress', 'develop', 'opportunity', 'success', 'value', 'effective'
-        ]
-        
-        self.negative_words = [
-            'risk', 'problem', 'concern', 'difficult', 'challenge', 'threat',
-            'danger', 'failure', 'loss', 'scam', 'fraud', 'waste', 'inefficient',
-            'corrupt', 'misleading', 'manipulation', 'exploit'
-        ]
+        # Positive/negative word lists for fallback come from the rules config (config/rules.json)
+        self.rules = rules or get_rule_store()
     
-    async def analyze(self, text: str) -> Dict[str, Any]:
+    async def analyze(self, text: str, use_model: bool = True, rules: Optional[RuleSnapshot] = None) -> Dict[str, Any]:
         """
         Analyze sentiment of proposal text
         Returns score from -100 (very negative) to +100 (very positive)
+        Set use_model=False to skip the transformer and use keywords (e.g. under load)
         """
         
-        if self.sentiment_pipeline and TRANSFORMERS_AVAILABLE:
+        rules = rules or self.rules.current()
+        
+        if use_model and self.sentiment_pipeline and TRANSFORMERS_AVAILABLE:
             try:
-                return await self._analyze_with_transformer(text)
+                result = await self._analyze_with_transformer(text)
+                result["rules_version"] = rules.version
+                return result
             except:
                 pass
         
         # Fallback to keyword-based analysis
-        return self._analyze_with_keywords(text)
+        return self._analyze_with_keywords(text, rules)
     
     async def _analyze_with_transformer(self, text: str) -> Dict[str, Any]:
         """Use transformer model for sentiment analysis"""
@@ -66,11 +63,12 @@ class SentimentAnalyzer(BaseAgent):
             chunk = ' '.join(words[i:i+max_length])
             chunks.append(chunk)
         
-        # Analyze each chunk
-        results = []
-        for chunk in chunks[:5]:  # Limit to first 5 chunks
-            result = self.sentiment_pipeline(chunk)[0]
-            results.append(result)
+        # Analyze each chunk (limit to first 5) in a worker thread: inference is CPU-bound
+        # and would otherwise stall the event loop, hiding the backlog from load shedding
+        def infer():
+            return [self.sentiment_pipeline(chunk)[0] for chunk in chunks[:5]]
+        
+        results = await asyncio.to_thread(infer)
         
         # Aggregate results
         total_score = 0
@@ -100,14 +98,43 @@ class SentimentAnalyzer(BaseAgent):
             "model": "DistilBERT"
         }
     
-    def _analyze_with_keywords(self, text: str) -> Dict[str, Any]:
+    def score_batch(
+        self,
+        texts: List[str],
+        use_model: bool = True,
+        rules: Optional[RuleSnapshot] = None,
+        batch_size: int = 32
+    ) -> Tuple[List[float], str]:
+        """
+        Score many short texts (e.g. vote reasons) in batched inference.
+        Returns one -100..+100 score per text and the model used.
+        Synchronous so callers can run it off the event loop.
+        """
+        
+        rules = rules or self.rules.current()
+        
+        if texts and use_model and self.sentiment_pipeline and TRANSFORMERS_AVAILABLE:
+            try:
+                results = self.sentiment_pipeline(texts, batch_size=batch_size, truncation=True)
+                scores = [
+                    r['score'] * 100 if r['label'] == 'POSITIVE' else -r['score'] * 100
+                    for r in results
+                ]
+                return [round(score, 2) for score in scores], "DistilBERT"
+            except:
+                pass
+        
+        return [self._analyze_with_keywords(text, rules)["score"] for text in texts], "Keyword-Based"
+    
+    def _analyze_with_keywords(self, text: str, rules: Optional[RuleSnapshot] = None) -> Dict[str, Any]:
         """Keyword-based sentiment analysis fallback"""
         
+        rules = rules or self.rules.current()
         text_lower = text.lower()
         words = text_lower.split()
         
-        positive_count = sum(1 for word in self.positive_words if word in text_lower)
-        negative_count = sum(1 for word in self.negative_words if word in text_lower)
+        positive_count = sum(1 for word in rules.positive_words if word in text_lower)
+        negative_count = sum(1 for word in rules.negative_words if word in text_lower)
         
         total_words = len(words)
         if total_words == 0:
@@ -115,7 +142,8 @@ class SentimentAnalyzer(BaseAgent):
                 "score": 0.0,
                 "sentiment": "Neutral",
                 "confidence": 0.0,
-                "model": "Keyword-Based"
+                "model": "Keyword-Based",
+                "rules_version": rules.version
             }
         
         # Calculate sentiment score
@@ -144,7 +172,8 @@ class SentimentAnalyzer(BaseAgent):
             "confidence": round(confidence, 2),
             "positive_words": positive_count,
             "negative_words": negative_count,
-            "model": "Keyword-Based"
+            "model": "Keyword-Based",
+            "rules_version": rules.version
         }
     
     async def process(self, **kwargs):
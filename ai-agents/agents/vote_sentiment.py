@@ -0,0 +1,232 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional
+
+from .rules import RuleSnapshot
+from .sentiment_analyzer import SentimentAnalyzer
+
+KEYWORD_MODEL = "Keyword-Based"
+
+
+def keyword_scorer(rules: RuleSnapshot) -> str:
+    """Scorer label for keyword scores, which depend on the rules version"""
+    return f"{KEYWORD_MODEL}@{rules.version}"
+
+class ProposalSentiment:
+    """
+    Running, voting-power-weighted sentiment for one proposal.
+    Each voter contributes once (Votes has a unique ProposalId/VoterId pair);
+    re-ingesting a voter replaces their previous contribution.
+    Vote counts are also kept per scorer ("DistilBERT" or "Keyword-Based@<rules version>").
+    """
+
+    __slots__ = (
+        "weighted_sum", "total_power", "vote_count", "power_by_type", "scored_with",
+        "votes", "buckets", "updated_at"
+    )
+
+    def __init__(self):
+        self.weighted_sum = 0.0
+        self.total_power = 0.0
+        self.vote_count = 0
+        self.power_by_type: Dict[str, float] = {}
+        self.scored_with: Dict[str, int] = {}
+        # voter_id -> (score, power, vote_type, bucket, scorer, reason); the reason is only kept for
+        # keyword scores, so they can be rescored when the rules change
+        self.votes: Dict[str, tuple] = {}
+        self.buckets: "OrderedDict[int, List[float]]" = OrderedDict()  # bucket start -> [weighted_sum, power, count]
+        self.updated_at = 0.0
+
+    def _apply(self, score: float, power: float, vote_type: str, bucket: int, scorer: str, sign: int):
+        self.weighted_sum += sign * score * power
+        self.total_power += sign * power
+        self.vote_count += sign
+        self.power_by_type[vote_type] = self.power_by_type.get(vote_type, 0.0) + sign * power
+        self.scored_with[scorer] = self.scored_with.get(scorer, 0) + sign
+        if not self.scored_with[scorer]:
+            del self.scored_with[scorer]
+
+        entry = self.buckets.get(bucket)
+        if entry is None:
+            if sign < 0:
+                return  # bucket already trimmed from the series
+            entry = self.buckets[bucket] = [0.0, 0.0, 0]
+        entry[0] += sign * score * power
+        entry[1] += sign * power
+        entry[2] += sign
+
+    def add(
+        self,
+        voter_id: str,
+        score: float,
+        power: float,
+        vote_type: str,
+        bucket: int,
+        max_buckets: int,
+        scorer: str,
+        reason: Optional[str] = None
+    ):
+        previous = self.votes.get(voter_id)
+        if previous is not None:
+            self._apply(*previous[:5], sign=-1)
+
+        self.votes[voter_id] = (score, power, vote_type, bucket, scorer, reason)
+        self._apply(score, power, vote_type, bucket, scorer, sign=1)
+
+        if len(self.buckets) > max_buckets:
+            self.buckets = OrderedDict(sorted(self.buckets.items())[-max_buckets:])
+        self.updated_at = time.time()
+
+    @property
+    def score(self) -> float:
+        return self.weighted_sum / self.total_power if self.total_power > 0 else 0.0
+
+
+class VoteSentimentAggregator:
+    """
+    Scores vote reasons in batches and keeps incrementally updated,
+    voting-power-weighted sentiment per proposal, plus a bucketed time series.
+    Reading the current aggregate is O(1), so ProposalAnalyzer can use it per analysis.
+    Keyword-scored reasons are rescored when the rules reload, so the aggregates
+    follow the active rules version.
+    """
+
+    def __init__(
+        self,
+        sentiment_analyzer: Optional[SentimentAnalyzer] = None,
+        bucket_seconds: int = 3600,
+        max_buckets: int = 24 * 30,
+        batch_size: int = 64
+    ):
+        self.sentiment_analyzer = sentiment_analyzer or SentimentAnalyzer()
+        self.bucket_seconds = bucket_seconds
+        self.max_buckets = max_buckets
+        self.batch_size = batch_size
+        self._proposals: Dict[int, ProposalSentiment] = {}
+        self._lock = threading.Lock()
+        self.sentiment_analyzer.rules.on_reload(self.rescore)
+
+    def ingest(self, votes: List[Dict[str, Any]], use_model: bool = True) -> Dict[str, Any]:
+        """
+        Score and aggregate a batch of votes.
+        Each vote needs proposal_id, voter_id, vote_type, voting_power and reason;
+        created_at (epoch seconds) places it in the time series, defaulting to now.
+        Synchronous (runs model inference); call it off the event loop.
+        """
+
+        scorable = [v for v in votes if v.get("reason") and str(v["reason"]).strip()]
+        skipped = len(votes) - len(scorable)
+
+        # One rules snapshot for the whole batch, recorded with every keyword score
+        rules = self.sentiment_analyzer.rules.current()
+        model = None
+        scores: List[float] = []
+        scorers: List[str] = []
+        for start in range(0, len(scorable), self.batch_size):
+            batch = scorable[start:start + self.batch_size]
+            batch_scores, model = self.sentiment_analyzer.score_batch(
+                [str(v["reason"]) for v in batch], use_model=use_model, rules=rules, batch_size=self.batch_size
+            )
+            scores.extend(batch_scores)
+            scorers.extend([keyword_scorer(rules) if model == KEYWORD_MODEL else model] * len(batch))
+
+        now = time.time()
+        touched = set()
+        with self._lock:
+            for vote, score, scorer in zip(scorable, scores, scorers):
+                proposal_id = int(vote["proposal_id"])
+                created_at = vote.get("created_at")
+                if created_at is None:
+                    created_at = now
+                bucket = int(created_at // self.bucket_seconds * self.bucket_seconds)
+
+                aggregate = self._proposals.get(proposal_id)
+                if aggregate is None:
+                    aggregate = self._proposals[proposal_id] = ProposalSentiment()
+                aggregate.add(
+                    str(vote["voter_id"]), score, max(float(vote.get("voting_power") or 0), 0.0),
+                    vote.get("vote_type", "Abstain"), bucket, self.max_buckets,
+                    scorer, str(vote["reason"]) if scorer != "DistilBERT" else None
+                )
+                touched.add(proposal_id)
+
+            proposals = [
+                {"proposal_id": proposal_id, **self._current_locked(proposal_id)} for proposal_id in sorted(touched)
+            ]
+
+        return {
+            "ingested": len(scorable),
+            "skipped": skipped,
+            "model": model or "None",
+            "rules_version": rules.version,
+            "proposals": proposals
+        }
+
+    def rescore(self, rules: RuleSnapshot):
+        """Rescore keyword-scored reasons from older rules versions with `rules` (RuleStore reload hook)"""
+        scorer = keyword_scorer(rules)
+        with self._lock:
+            stale = [
+                (aggregate, voter_id, vote)
+                for aggregate in self._proposals.values()
+                for voter_id, vote in aggregate.votes.items()
+                if vote[5] is not None and vote[4] != scorer
+            ]
+        if not stale:
+            return
+
+        scores, _ = self.sentiment_analyzer.score_batch([vote[5] for _, _, vote in stale], use_model=False, rules=rules)
+
+        with self._lock:
+            for (aggregate, voter_id, vote), score in zip(stale, scores):
+                if aggregate.votes.get(voter_id) is not vote:
+                    continue  # replaced by a newer vote in the meantime
+                _, power, vote_type, bucket, _, reason = vote
+                aggregate.add(voter_id, score, power, vote_type, bucket, self.max_buckets, scorer, reason)
+
+    def current(self, proposal_id: int) -> Optional[Dict[str, Any]]:
+        """Current aggregate for a proposal, or None if no reasons were ingested"""
+        with self._lock:
+            return self._current_locked(proposal_id)
+
+    def _current_locked(self, proposal_id: int) -> Optional[Dict[str, Any]]:
+        aggregate = self._proposals.get(proposal_id)
+        if aggregate is None or aggregate.vote_count == 0:
+            return None
+
+        return {
+            "score": round(aggregate.score, 2),
+            "total_voting_power": round(aggregate.total_power, 8),
+            "vote_count": aggregate.vote_count,
+            "voting_power_by_type": {k: round(v, 8) for k, v in aggregate.power_by_type.items() if v > 0},
+            "scored_with": dict(aggregate.scored_with),
+            "updated_at": aggregate.updated_at
+        }
+
+    def current_score(self, proposal_id: int) -> Optional[float]:
+        """Weighted community sentiment (-100..+100), or None when unknown"""
+        with self._lock:
+            aggregate = self._proposals.get(proposal_id)
+            if aggregate is None or aggregate.total_power <= 0:
+                return None
+            return round(aggregate.score, 2)
+
+    def time_series(self, proposal_id: int) -> List[Dict[str, Any]]:
+        """Per-bucket weighted sentiment, oldest first"""
+        with self._lock:
+            aggregate = self._proposals.get(proposal_id)
+            if aggregate is None:
+                return []
+            buckets = sorted((bucket, tuple(entry)) for bucket, entry in aggregate.buckets.items())
+
+        return [
+            {
+                "bucket_start": bucket,
+                "score": round(weighted_sum / power, 2) if power > 0 else 0.0,
+                "voting_power": round(power, 8),
+                "vote_count": count
+            }
+            for bucket, (weighted_sum, power, count) in buckets
+            if count > 0
+        ]
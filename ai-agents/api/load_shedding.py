@@ -0,0 +1,144 @@
+import asyncio
+import math
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Optional
+
+from agents.pipeline import ANALYSIS_TIERS, TIER_FULL
+
+class AdaptiveLoadShedder:
+    """
+    Admission controller that degrades new requests to cheaper analysis tiers
+    when queue latency exceeds the configured SLO.
+
+    Requests queue for one of `max_concurrency` slots. The time from arrival
+    (stamped by ArrivalTimeMiddleware) until a slot is acquired is smoothed into an EWMA (which also decays over `window_s` between requests).
+    Above `slo_ms * degrade_ratio` the tier steps down one level; it only steps
+    back up after the EWMA has stayed below `slo_ms * recover_ratio` for
+    `recover_after_s` seconds (hysteresis).
+    """
+
+    def __init__(
+        self,
+        slo_ms: float = 2000.0,
+        max_concurrency: int = 8,
+        enabled: bool = True,
+        degrade_ratio: float = 1.0,
+        recover_ratio: float = 0.5,
+        degrade_cooldown_s: float = 1.0,
+        recover_after_s: float = 10.0,
+        smoothing: float = 0.2,
+        window_s: float = 5.0
+    ):
+        self.slo_ms = slo_ms
+        self.max_concurrency = max_concurrency
+        self.enabled = enabled
+        self.degrade_ratio = degrade_ratio
+        self.recover_ratio = recover_ratio
+        self.degrade_cooldown_s = degrade_cooldown_s
+        self.recover_after_s = recover_after_s
+        self.smoothing = smoothing
+        self.window_s = window_s
+
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._level = 0  # index into ANALYSIS_TIERS
+        self._queue_latency_ms = 0.0
+        self._last_change = 0.0
+        self._last_observed = None
+        self._calm_since = None
+        self._waiting = 0
+        self._in_flight = 0
+        self._admitted = {tier: 0 for tier in ANALYSIS_TIERS}
+
+    @classmethod
+    def from_env(cls) -> "AdaptiveLoadShedder":
+        return cls(
+            slo_ms=float(os.getenv("ANALYSIS_LATENCY_SLO_MS", "2000")),
+            max_concurrency=int(os.getenv("MAX_CONCURRENT_ANALYSES", "8")),
+            enabled=os.getenv("LOAD_SHEDDING_ENABLED", "true").lower() == "true",
+            recover_after_s=float(os.getenv("LOAD_SHEDDING_RECOVER_AFTER_S", "10"))
+        )
+
+    @property
+    def tier(self) -> str:
+        return ANALYSIS_TIERS[self._level]
+
+    @asynccontextmanager
+    async def admit(self, arrived_at: Optional[float] = None):
+        """
+        Wait for a slot and yield the tier this request should run at.
+        `arrived_at` is the request's time.monotonic() arrival stamp; queue latency is
+        measured from it, so time spent waiting on a busy event loop is included.
+        """
+        enqueued = arrived_at if arrived_at is not None else time.monotonic()
+        self._waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self._waiting -= 1
+
+        now = time.monotonic()
+        self._observe((now - enqueued) * 1000, now)
+        tier = self.tier if self.enabled else TIER_FULL
+        self._admitted[tier] += 1
+        self._in_flight += 1
+        try:
+            yield tier
+        finally:
+            self._in_flight -= 1
+            self._slots.release()
+
+    def _observe(self, queue_latency_ms: float, now: float):
+        alpha = self.smoothing
+        if self._last_observed is not None:
+            alpha = max(alpha, 1 - math.exp(-(now - self._last_observed) / self.window_s))
+        self._last_observed = now
+        self._queue_latency_ms += alpha * (queue_latency_ms - self._queue_latency_ms)
+
+        if self._queue_latency_ms > self.slo_ms * self.degrade_ratio:
+            self._calm_since = None
+            if self._level < len(ANALYSIS_TIERS) - 1 and now - self._last_change >= self.degrade_cooldown_s:
+                self._level += 1
+                self._last_change = now
+        elif self._queue_latency_ms < self.slo_ms * self.recover_ratio:
+            if self._calm_since is None:
+                self._calm_since = now
+            elif self._level > 0 and now - self._calm_since >= self.recover_after_s:
+                self._level -= 1
+                self._last_change = now
+                self._calm_since = now
+        else:
+            self._calm_since = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "current_tier": self.tier,
+            "queue_latency_ms": round(self._queue_latency_ms, 2),
+            "slo_ms": self.slo_ms,
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self._in_flight,
+            "waiting": self._waiting,
+            "admitted_by_tier": dict(self._admitted)
+        }
+
+
+class ArrivalTimeMiddleware:
+    """
+    ASGI middleware stamping request.state.arrived_at with time.monotonic()
+    as soon as the request reaches the app, for AdaptiveLoadShedder.admit()
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            scope.setdefault("state", {})["arrived_at"] = time.monotonic()
+        await self.app(scope, receive, send)
+
+
+def arrival_time(request) -> Optional[float]:
+    """Arrival stamp set by ArrivalTimeMiddleware, if installed"""
+    return getattr(request.state, "arrived_at", None)
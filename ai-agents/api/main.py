@@ -1,7 +1,7 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Optional, Literal
+from fastapi.concurrency import run_in_threadpool
+import asyncio
 import os
 from dotenv import load_dotenv
 
@@ -13,13 +13,21 @@ from agents.proposal_analyzer import ProposalAnalyzer
 from agents.risk_assessor import RiskAssessor
 from agents.fraud_detector import FraudDetector
 from agents.sentiment_analyzer import SentimentAnalyzer
+from agents.pipeline import AnalysisPipeline, TIER_FULL, TIER_MINIMAL
+from agents.rules import get_rule_store
+from agents.vote_sentiment import VoteSentimentAggregator
+from agents.impact_simulator import ImpactSimulator
+from api.load_shedding import AdaptiveLoadShedder, ArrivalTimeMiddleware, arrival_time
+from api.models import AnalysisRequest, AnalysisResponse, HealthResponse, SimulationRequest, VoteSentimentRequest
+from api.responses import DefaultResponse, negotiated_response
 
 load_dotenv()
 
 app = FastAPI(
     title="AI-DAO Governance Agent Service",
     description="AI agents for analyzing DAO proposals and providing recommendations",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=DefaultResponse
 )
 
 # CORS
@@ -31,39 +39,36 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Outermost, so load shedding measures queue latency from the moment a request arrives
+app.add_middleware(ArrivalTimeMiddleware)
+
+# Scoring rules (config/rules.json), shared by all agents and hot-reloadable
+rule_store = get_rule_store()
+
 # Initialize AI agents
-proposal_analyzer = ProposalAnalyzer()
+sentiment_analyzer = SentimentAnalyzer()
+vote_sentiment = VoteSentimentAggregator(sentiment_analyzer)
+proposal_analyzer = ProposalAnalyzer(vote_sentiment=vote_sentiment)
 risk_assessor = RiskAssessor()
 fraud_detector = FraudDetector()
-sentiment_analyzer = SentimentAnalyzer()
+impact_simulator = ImpactSimulator(
+    time_budget_ms=float(os.getenv("SIMULATION_TIME_BUDGET_MS", "50"))
+)
+analysis_pipeline = AnalysisPipeline(
+    proposal_analyzer=proposal_analyzer,
+    risk_assessor=risk_assessor,
+    fraud_detector=fraud_detector,
+    sentiment_analyzer=sentiment_analyzer
+)
+load_shedder = AdaptiveLoadShedder.from_env()
+# Bulk vote ingestion gets its own slots so long batches never hold analysis slots
+vote_ingest_slots = asyncio.Semaphore(int(os.getenv("MAX_CONCURRENT_VOTE_INGESTS", "1")))
 
-# Request/Response models
-class AnalysisRequest(BaseModel):
-    proposal_id: int
-    title: str
-    description: str
-    proposal_type: str
-    requested_amount: float
-    submitter_address: str
-    analysis_type: Literal["RiskAssessment", "FraudDetection", "ImpactSimulation", "Full"] = "Full"
-
-class AnalysisResponse(BaseModel):
-    proposal_id: int
-    risk_score: float  # 0-100
-    fraud_probability: float  # 0-100
-    sentiment_score: float  # -100 to +100
-    recommended_action: str  # "Approve", "Reject", "Review"
-    confidence_level: float  # 0-100
-    key_insights: str
-    detailed_analysis: str
-    model_used: str
-    processing_time: int  # milliseconds
-
-class HealthResponse(BaseModel):
-    status: str
-    openai_available: bool
-    local_model_available: bool
-    version: str
+@app.on_event("startup")
+async def start_rules_watcher():
+    interval = float(os.getenv("RULES_WATCH_INTERVAL_S", "5"))
+    if interval > 0:
+        rule_store.watch(interval)
 
 @app.get("/", response_model=dict)
 async def root():
@@ -76,7 +81,12 @@ async def root():
             "analyze": "/api/analyze",
             "risk": "/api/risk",
             "fraud": "/api/fraud",
-            "sentiment": "/api/sentiment"
+            "sentiment": "/api/sentiment",
+            "simulate": "/api/simulate",
+            "vote_sentiment": "/api/votes/sentiment",
+            "load": "/api/load",
+            "pipeline_stats": "/api/pipeline/stats",
+            "rules": "/admin/rules"
         }
     }
 
@@ -94,7 +104,7 @@ async def health_check():
     )
 
 @app.post("/api/analyze", response_model=AnalysisResponse)
-async def analyze_proposal(request: AnalysisRequest):
+async def analyze_proposal(request: AnalysisRequest, http_request: Request):
     """
     Comprehensive AI analysis of a DAO proposal
     
@@ -105,59 +115,26 @@ async def analyze_proposal(request: AnalysisRequest):
     - Impact simulation
     """
     try:
-        import time
-        start_time = time.time()
+        async with load_shedder.admit(arrival_time(http_request)) as tier:
+            result = await analysis_pipeline.run(
+                proposal_id=request.proposal_id,
+                title=request.title,
+                description=request.description,
+                proposal_type=request.proposal_type,
+                requested_amount=request.requested_amount,
+                submitter_address=request.submitter_address,
+                tier=tier
+            )
         
-        # Perform analyses
-        risk_result = await risk_assessor.assess(
-            title=request.title,
-            description=request.description,
-            proposal_type=request.proposal_type,
-            requested_amount=request.requested_amount
-        )
-        
-        fraud_result = await fraud_detector.detect(
-            submitter=request.submitter_address,
-            description=request.description,
-            requested_amount=request.requested_amount
-        )
-        
-        sentiment_result = await sentiment_analyzer.analyze(
-            text=f"{request.title}. {request.description}"
-        )
-        
-        # Comprehensive analysis
-        comprehensive_analysis = await proposal_analyzer.analyze(
-            proposal_id=request.proposal_id,
-            title=request.title,
-            description=request.description,
-            proposal_type=request.proposal_type,
-            requested_amount=request.requested_amount,
-            risk_score=risk_result["score"],
-            fraud_probability=fraud_result["probability"],
-            sentiment_score=sentiment_result["score"]
-        )
-        
-        processing_time = int((time.time() - start_time) * 1000)
-        
-        return AnalysisResponse(
-            proposal_id=request.proposal_id,
-            risk_score=risk_result["score"],
-            fraud_probability=fraud_result["probability"],
-            sentiment_score=sentiment_result["score"],
-            recommended_action=comprehensive_analysis["recommendation"],
-            confidence_level=comprehensive_analysis["confidence"],
-            key_insights=comprehensive_analysis["key_insights"],
-            detailed_analysis=comprehensive_analysis["detailed_analysis"],
-            model_used=comprehensive_analysis["model_used"],
-            processing_time=processing_time
-        )
+        # Pipeline output is trusted and already in the AnalysisResponse layout:
+        # serialize the dict directly, skipping model validation and dumping
+        return negotiated_response(http_request, result)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
 @app.post("/api/risk")
-async def assess_risk(request: AnalysisRequest):
+async def assess_risk(request: AnalysisRequest, http_request: Request):
     """Assess risk level of a proposal"""
     try:
         result = await risk_assessor.assess(
@@ -166,12 +143,12 @@ async def assess_risk(request: AnalysisRequest):
             proposal_type=request.proposal_type,
             requested_amount=request.requested_amount
         )
-        return result
+        return negotiated_response(http_request, result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Risk assessment failed: {str(e)}")
 
 @app.post("/api/fraud")
-async def detect_fraud(request: AnalysisRequest):
+async def detect_fraud(request: AnalysisRequest, http_request: Request):
     """Detect potential fraud indicators"""
     try:
         result = await fraud_detector.detect(
@@ -179,21 +156,87 @@ async def detect_fraud(request: AnalysisRequest):
             description=request.description,
             requested_amount=request.requested_amount
         )
-        return result
+        return negotiated_response(http_request, result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Fraud detection failed: {str(e)}")
 
 @app.post("/api/sentiment")
-async def analyze_sentiment(request: AnalysisRequest):
+async def analyze_sentiment(request: AnalysisRequest, http_request: Request):
     """Analyze sentiment of proposal text"""
     try:
-        result = await sentiment_analyzer.analyze(
-            text=f"{request.title}. {request.description}"
-        )
-        return result
+        async with load_shedder.admit(arrival_time(http_request)) as tier:
+            result = await sentiment_analyzer.analyze(
+                text=f"{request.title}. {request.description}",
+                use_model=tier != TIER_MINIMAL
+            )
+        # Tier actually used: a transformer failure falls back to keywords (minimal)
+        result["analysis_tier"] = analysis_pipeline.sentiment_tier(result)
+        return negotiated_response(http_request, result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Sentiment analysis failed: {str(e)}")
 
+@app.post("/api/simulate")
+async def simulate_impact(request: SimulationRequest, http_request: Request):
+    """Monte Carlo simulation of vote outcome and treasury impact (SimulationResults layout)"""
+    try:
+        params = request.model_dump()
+        result = await run_in_threadpool(lambda: impact_simulator.run(**params))
+        return negotiated_response(http_request, result)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Impact simulation failed: {str(e)}")
+
+@app.post("/api/votes/sentiment")
+async def ingest_vote_sentiment(request: VoteSentimentRequest, http_request: Request):
+    """Score vote reasons in bulk and update per-proposal community sentiment"""
+    try:
+        # Follow the analysis tier (keywords when analyses are shed to minimal) without taking a slot
+        tier = load_shedder.tier if load_shedder.enabled else TIER_FULL
+        async with vote_ingest_slots:
+            result = await run_in_threadpool(
+                vote_sentiment.ingest,
+                [vote.model_dump() for vote in request.votes],
+                tier != TIER_MINIMAL
+            )
+        result["analysis_tier"] = analysis_pipeline.sentiment_tier(result)
+        return negotiated_response(http_request, result)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Vote sentiment ingestion failed: {str(e)}")
+
+@app.get("/api/votes/sentiment/{proposal_id}")
+async def get_vote_sentiment(proposal_id: int, http_request: Request):
+    """Current weighted community sentiment and its time series for a proposal"""
+    aggregate = vote_sentiment.current(proposal_id)
+    if aggregate is None:
+        raise HTTPException(status_code=404, detail=f"No vote reasons ingested for proposal {proposal_id}")
+    return negotiated_response(http_request, {
+        "proposal_id": proposal_id,
+        **aggregate,
+        "time_series": vote_sentiment.time_series(proposal_id)
+    })
+
+@app.get("/api/load")
+async def load_status():
+    """Current load-shedding tier and queue latency"""
+    return load_shedder.stats()
+
+@app.get("/api/pipeline/stats")
+async def pipeline_stats():
+    """Early-exit counts and estimated transformer time saved"""
+    return analysis_pipeline.stats.snapshot()
+
+@app.get("/admin/rules")
+async def rules_status():
+    """Currently active scoring rules version"""
+    return {"version": rule_store.version, "path": rule_store.path}
+
+@app.post("/admin/rules/reload")
+async def reload_rules():
+    """Recompile the rules file and atomically swap it in; in-flight requests keep their snapshot"""
+    result = await run_in_threadpool(rule_store.reload)
+    if "error" in result:
+        raise HTTPException(status_code=422, detail=f"Rules reload failed: {result['error']}")
+    return result
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
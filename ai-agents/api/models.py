@@ -0,0 +1,65 @@
+from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
+
+# Request/Response models
+class AnalysisRequest(BaseModel):
+    proposal_id: int
+    title: str
+    description: str
+    proposal_type: str
+    requested_amount: float
+    submitter_address: str
+    analysis_type: Literal["RiskAssessment", "FraudDetection", "ImpactSimulation", "Full"] = "Full"
+
+class AnalysisResponse(BaseModel):
+    proposal_id: int
+    risk_score: float  # 0-100
+    fraud_probability: float  # 0-100
+    sentiment_score: float  # -100 to +100
+    recommended_action: str  # "Approve", "Reject", "Review"
+    confidence_level: float  # 0-100
+    key_insights: str
+    detailed_analysis: str
+    model_used: str
+    processing_time: int  # milliseconds
+    recommendation_method: str = "llm"  # "llm", or "rules" when the rule-based recommendation was used
+    analysis_tier: str = "full"  # "full", "reduced", "minimal"; anything below full should be re-analyzed later
+    rules_version: str = ""  # version of config/rules.json the scores were computed with
+    community_sentiment_score: Optional[float] = None  # -100 to +100, weighted by voting power; None without vote reasons
+    skipped_stages: List[str] = []  # expensive stages skipped because the rule-based outcome was already settled
+    early_exit_reason: Optional[str] = None
+
+class HealthResponse(BaseModel):
+    status: str
+    openai_available: bool
+    local_model_available: bool
+    version: str
+
+class VoteReason(BaseModel):
+    proposal_id: int
+    voter_id: str  # Votes.VoterId or wallet address; one vote per voter per proposal
+    vote_type: Literal["For", "Against", "Abstain"]
+    voting_power: float
+    reason: Optional[str] = None
+    created_at: Optional[float] = None  # epoch seconds; defaults to ingestion time
+
+class VoteSentimentRequest(BaseModel):
+    votes: List[VoteReason]
+
+class SimulationRequest(BaseModel):
+    proposal_id: int
+    requested_amount: float
+    treasury_balance: float
+    monthly_spend: float = 0.0  # expected treasury outflow per month, excluding this proposal
+    horizon_months: int = Field(12, ge=1, le=120)
+    token_share: float = 0.5  # fraction of the treasury held in the governance token
+    token_volatility: float = 0.8  # annualized
+    quorum_required: float = 10.0  # percentage
+    approval_threshold: float = 50.0  # percentage
+    expected_turnout: float = 0.2
+    risk_score: float = 50.0
+    fraud_probability: float = 0.0
+    sentiment_score: float = 0.0
+    scenarios: Optional[int] = Field(None, ge=1, le=200000)
+    time_budget_ms: Optional[float] = Field(None, gt=0, le=5000)
+    seed: Optional[int] = None  # defaults to proposal_id, so repeated runs are reproducible
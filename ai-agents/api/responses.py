@@ -0,0 +1,118 @@
+import gzip
+import json
+import os
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack", "application/vnd.msgpack")
+# Accept values that JSON (the default format) satisfies
+JSON_MEDIA_TYPES = ("application/json", "application/*", "*/*")
+
+# Bodies smaller than this are sent uncompressed; compression costs more than it saves
+COMPRESSION_MIN_BYTES = int(os.getenv("RESPONSE_COMPRESSION_MIN_BYTES", "1024"))
+GZIP_LEVEL = int(os.getenv("RESPONSE_GZIP_LEVEL", "5"))
+ZSTD_LEVEL = int(os.getenv("RESPONSE_ZSTD_LEVEL", "3"))
+
+# Default class for endpoints that return plain dicts
+DefaultResponse = ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+
+_zstd_compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL) if ZSTD_AVAILABLE else None
+
+
+def _accepted(header: Optional[str]) -> Dict[str, float]:
+    """Parse an Accept / Accept-Encoding header into {value: q}"""
+    accepted = {}
+    for part in (header or "").split(","):
+        fields = part.strip().split(";")
+        value = fields[0].strip().lower()
+        if not value:
+            continue
+        q = 1.0
+        for param in fields[1:]:
+            name, _, raw = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(raw)
+                except ValueError:
+                    q = 0.0
+        accepted[value] = q
+    return accepted
+
+
+def encode_body(payload: Dict[str, Any], accept: Optional[str]) -> Tuple[bytes, str]:
+    """Serialize to MessagePack when the client prefers it (strictly higher q than JSON), JSON otherwise"""
+    accepted = _accepted(accept)
+    msgpack_q = max(accepted.get(media_type, 0) for media_type in MSGPACK_MEDIA_TYPES)
+    json_q = max(accepted.get(media_type, 0) for media_type in JSON_MEDIA_TYPES)
+    if MSGPACK_AVAILABLE and msgpack_q > 0 and msgpack_q > json_q:
+        return msgpack.packb(payload, use_bin_type=True), "application/msgpack"
+
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload), "application/json"
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), "application/json"
+
+
+def _encoding_q(accepted: Dict[str, float], coding: str) -> float:
+    """q of a content coding: listed explicitly, else via "*", else identity only"""
+    if coding in accepted:
+        return accepted[coding]
+    if "*" in accepted:
+        return accepted["*"]
+    return 1.0 if coding == "identity" else 0.0
+
+
+def compress_body(body: bytes, accept_encoding: Optional[str]) -> Tuple[bytes, Optional[str]]:
+    """
+    Compress with the accepted coding of highest q (zstd wins ties with gzip, compression wins
+    ties with identity). Bodies below COMPRESSION_MIN_BYTES are only compressed if identity is refused.
+    """
+    accepted = _accepted(accept_encoding)
+    identity_q = _encoding_q(accepted, "identity")
+    if len(body) < COMPRESSION_MIN_BYTES and identity_q > 0:
+        return body, None
+
+    codings = ("zstd", "gzip") if ZSTD_AVAILABLE else ("gzip",)
+    coding = max(codings, key=lambda c: _encoding_q(accepted, c))
+    coding_q = _encoding_q(accepted, coding)
+    if coding_q <= 0 or coding_q < identity_q:
+        return body, None
+
+    if coding == "zstd":
+        return _zstd_compressor.compress(body), "zstd"
+    return gzip.compress(body, compresslevel=GZIP_LEVEL), "gzip"
+
+
+def negotiated_response(request: Request, payload: Dict[str, Any], status_code: int = 200) -> Response:
+    """
+    Build a response in the format and encoding the client negotiated.
+    Returning a Response directly bypasses FastAPI's response_model validation,
+    so only use this with plain dicts built by the service itself.
+    """
+    body, media_type = encode_body(payload, request.headers.get("accept"))
+    body, encoding = compress_body(body, request.headers.get("accept-encoding"))
+
+    headers = {"Vary": "Accept, Accept-Encoding"}
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, status_code=status_code, media_type=media_type, headers=headers)
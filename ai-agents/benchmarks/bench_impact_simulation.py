@@ -0,0 +1,123 @@
+"""
+Compare the vectorized ImpactSimulator against a naive per-scenario Python loop
+running the same model.
+
+Usage:
+    python benchmarks/bench_impact_simulation.py [--scenarios 20000] [--repeat 5]
+"""
+
+import argparse
+import math
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.impact_simulator import ImpactSimulator
+
+PARAMS = dict(
+    proposal_id=42,
+    requested_amount=75000.0,
+    treasury_balance=1_000_000.0,
+    monthly_spend=30000.0,
+    horizon_months=12,
+    token_share=0.5,
+    token_volatility=0.8,
+    quorum_required=10.0,
+    approval_threshold=50.0,
+    expected_turnout=0.2,
+    risk_score=40.0,
+    fraud_probability=5.0,
+    sentiment_score=30.0,
+    reserve_floor=0.25,
+)
+
+
+def naive_simulation(scenarios: int, seed: int, p: dict, approval: float) -> dict:
+    """One scenario at a time with the random module: the straightforward implementation"""
+    rng = random.Random(seed)
+    concentration = 20.0
+    turnout = p["expected_turnout"]
+    months = p["horizon_months"]
+    vol = p["token_volatility"]
+    dt = 1 / 12
+    stable = p["treasury_balance"] * (1 - p["token_share"])
+    tokens = p["treasury_balance"] * p["token_share"]
+    paid_from_stable = min(p["requested_amount"], stable)
+    paid_from_tokens = min(p["requested_amount"] - paid_from_stable, tokens)
+    floor = p["reserve_floor"] * p["treasury_balance"]
+
+    passed_count = 0
+    shortfalls = 0
+    finals = []
+    for _ in range(scenarios):
+        turnout_draw = rng.betavariate(turnout * concentration, (1 - turnout) * concentration)
+        retail = rng.betavariate(approval * concentration, (1 - approval) * concentration)
+        whale_share = rng.betavariate(2.0, 5.0)
+        whale_for = 1.0 if rng.random() < approval else 0.0
+        approval_draw = whale_share * whale_for + (1 - whale_share) * retail
+        if turnout_draw >= p["quorum_required"] / 100 and approval_draw > p["approval_threshold"] / 100:
+            passed_count += 1
+
+        log_price = 0.0
+        spent = 0.0
+        lowest = float("inf")
+        value = 0.0
+        for _ in range(months):
+            log_price += -0.5 * vol ** 2 * dt + vol * math.sqrt(dt) * rng.gauss(0, 1)
+            spent += p["monthly_spend"] * rng.lognormvariate(-0.5 * 0.3 ** 2, 0.3)
+            value = (stable - paid_from_stable) + (tokens - paid_from_tokens) * math.exp(log_price) - spent
+            lowest = min(lowest, value)
+        finals.append(value)
+        if lowest < floor:
+            shortfalls += 1
+
+    finals.sort()
+    return {
+        "success_probability": passed_count / scenarios * 100,
+        "shortfall_probability": shortfalls / scenarios * 100,
+        "median_final": finals[len(finals) // 2],
+    }
+
+
+def timed(fn, repeat: int):
+    times = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return result, statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenarios", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    simulator = ImpactSimulator(max_scenarios=max(args.scenarios, 200000))
+    approval = simulator._expected_approval(PARAMS["risk_score"], PARAMS["fraud_probability"], PARAMS["sentiment_score"])
+
+    vectorized, vectorized_ms = timed(
+        lambda: simulator.run(scenarios=args.scenarios, time_budget_ms=float("inf"), **PARAMS), args.repeat
+    )
+    naive, naive_ms = timed(
+        lambda: naive_simulation(args.scenarios, PARAMS["proposal_id"], PARAMS, approval), max(1, args.repeat // 2)
+    )
+
+    data = vectorized["simulation_data"]
+    print(f"{args.scenarios} scenarios x {PARAMS['horizon_months']} months (median of runs)\n")
+    print(f"{'implementation':<16} {'time':>10} {'success %':>10} {'shortfall %':>12} {'median final':>14}")
+    print(f"{'numpy':<16} {vectorized_ms:>8.1f}ms {vectorized['success_probability']:>10.2f} "
+          f"{data['shortfall_probability']:>12.2f} {data['final_treasury_if_executed']['p50']:>14,.0f}")
+    print(f"{'python loop':<16} {naive_ms:>8.1f}ms {naive['success_probability']:>10.2f} "
+          f"{naive['shortfall_probability']:>12.2f} {naive['median_final']:>14,.0f}")
+    print(f"\nspeedup: {naive_ms / vectorized_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Compare per-request CPU time and payload size of AnalysisResponse serialization paths.
+
+Usage:
+    python benchmarks/bench_serialization.py [--iterations 5000]
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.models import AnalysisResponse
+from api import responses
+
+
+def sample_result() -> dict:
+    """A realistically sized pipeline result (rule-based insights and analysis text)"""
+    insights = "\n".join(
+        f"• Insight {i}: risk, fraud and sentiment signals for this Treasury proposal" for i in range(5)
+    )
+    detailed = " ".join(
+        ["This Treasury proposal requests $75,000.00 in funding for community infrastructure."] * 40
+    )
+    return {
+        "proposal_id": 4211,
+        "risk_score": 47.25,
+        "fraud_probability": 12.5,
+        "sentiment_score": 38.4,
+        "recommended_action": "Review",
+        "confidence_level": 60.0,
+        "key_insights": insights,
+        "detailed_analysis": detailed,
+        "model_used": "GPT-4-Hybrid",
+        "processing_time": 1234,
+        "analysis_tier": "full",
+    }
+
+
+def fastapi_default(result: dict) -> bytes:
+    """What FastAPI does for `return AnalysisResponse(**result)` with response_model set:
+    validate on construction, dump, re-validate against response_model, serialize, json.dumps"""
+    model = AnalysisResponse(**result)
+    validated = AnalysisResponse.model_validate(model.model_dump())
+    return json.dumps(
+        validated.model_dump(mode="json"), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def trusted_json(result: dict) -> bytes:
+    """What /api/analyze does: encode the pipeline dict directly"""
+    body, _ = responses.encode_body(result, "application/json")
+    return body
+
+
+def trusted_msgpack(result: dict) -> bytes:
+    body, _ = responses.encode_body(result, "application/msgpack")
+    return body
+
+
+def with_gzip(encoder):
+    return lambda result: gzip.compress(encoder(result), compresslevel=responses.GZIP_LEVEL)
+
+
+def with_zstd(encoder):
+    return lambda result: responses._zstd_compressor.compress(encoder(result))
+
+
+def bench(name: str, fn, result: dict, iterations: int):
+    fn(result)  # warm up
+    start = time.process_time()
+    for _ in range(iterations):
+        body = fn(result)
+    cpu_us = (time.process_time() - start) / iterations * 1e6
+    print(f"{name:<32} {cpu_us:>10.1f} us/req {len(body):>10} bytes")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+
+    result = sample_result()
+    json_name = "dict + orjson" if responses.ORJSON_AVAILABLE else "dict + json"
+
+    print(f"{'path':<32} {'CPU':>17} {'payload':>16}")
+    bench("fastapi default (validate+json)", fastapi_default, result, args.iterations)
+    bench(json_name, trusted_json, result, args.iterations)
+    bench(json_name + " + gzip", with_gzip(trusted_json), result, args.iterations)
+    if responses.ZSTD_AVAILABLE:
+        bench(json_name + " + zstd", with_zstd(trusted_json), result, args.iterations)
+    if responses.MSGPACK_AVAILABLE:
+        bench("dict + msgpack", trusted_msgpack, result, args.iterations)
+        if responses.ZSTD_AVAILABLE:
+            bench("dict + msgpack + zstd", with_zstd(trusted_msgpack), result, args.iterations)
+
+
+if __name__ == "__main__":
+    main()
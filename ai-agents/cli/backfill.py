@@ -0,0 +1,496 @@
+"""
+Bulk historical backfill: re-score past proposals without going through HTTP.
+
+Usage:
+    python -m cli.backfill proposals.jsonl results.jsonl
+    python -m cli.backfill proposals.csv results_parquet/ --output-format parquet --workers 8
+
+Input can be JSONL, CSV (including `COPY Proposals TO ... WITH (FORMAT csv, HEADER)`)
+or the default Postgres text `COPY Proposals TO ...` export. Results are written in the
+AIAnalysis column layout. Progress is checkpointed next to the output so an interrupted
+run picks up where it stopped.
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime, timezone
+from typing import Callable, Dict, Any, Iterator, List, Optional, Set
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Column order of the Proposals table, used for header-less COPY exports
+PROPOSALS_COLUMNS = [
+    "ProposalId", "BlockchainProposalId", "Title", "Description", "ProposalType",
+    "RequestedAmount", "RecipientAddress", "SubmittedBy", "Status",
+    "VotingStartTime", "VotingEndTime", "QuorumRequired", "ApprovalThreshold",
+    "CreatedAt", "UpdatedAt", "ExecutedAt"
+]
+
+# Column order of the AIAnalysis table (AnalysisId is assigned by the database)
+AI_ANALYSIS_COLUMNS = [
+    "ProposalId", "AnalysisType", "RiskScore", "FraudProbability", "SentimentScore",
+    "RecommendedAction", "ConfidenceLevel", "KeyInsights", "DetailedAnalysis",
+    "ModelUsed", "ProcessingTime", "CreatedAt"
+]
+
+# Normalized input column name -> pipeline argument
+FIELD_ALIASES = {
+    "proposalid": "proposal_id",
+    "id": "proposal_id",
+    "title": "title",
+    "description": "description",
+    "proposaltype": "proposal_type",
+    "type": "proposal_type",
+    "requestedamount": "requested_amount",
+    "amount": "requested_amount",
+    "submitteraddress": "submitter_address",
+    "submitter": "submitter_address",
+    "submittedby": "submitter_address",
+}
+
+COPY_ESCAPES = {"b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t", "v": "\v", "\\": "\\"}
+
+
+def _normalize_record(record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Map a raw input row onto AnalysisPipeline.run arguments"""
+    proposal = {}
+    for key, value in record.items():
+        field = FIELD_ALIASES.get(str(key).lower().replace("_", ""))
+        if field and field not in proposal:
+            proposal[field] = value
+
+    if proposal.get("proposal_id") in (None, "") or not proposal.get("description"):
+        return None
+
+    return {
+        "proposal_id": int(proposal["proposal_id"]),
+        "title": proposal.get("title") or "",
+        "description": proposal["description"],
+        "proposal_type": proposal.get("proposal_type") or "Governance",
+        "requested_amount": float(proposal.get("requested_amount") or 0),
+        "submitter_address": str(proposal.get("submitter_address") or ""),
+    }
+
+
+def _decode_copy_field(value: str) -> Optional[str]:
+    """Decode a field of the Postgres COPY text format"""
+    if value == "\\N":
+        return None
+    if "\\" not in value:
+        return value
+
+    out = []
+    i = 0
+    while i < len(value):
+        ch = value[i]
+        if ch == "\\" and i + 1 < len(value):
+            out.append(COPY_ESCAPES.get(value[i + 1], value[i + 1]))
+            i += 2
+        else:
+            out.append(ch)
+            i += 1
+    return "".join(out)
+
+
+def _parse_row(raw: Any, input_format: str) -> Dict[str, Any]:
+    if input_format == "jsonl":
+        return json.loads(raw)
+    if input_format == "copy":
+        return dict(zip(PROPOSALS_COLUMNS, map(_decode_copy_field, raw.rstrip("\n").split("\t"))))
+    return raw
+
+
+def iter_proposals(
+    path: str,
+    input_format: str,
+    on_error: Optional[Callable[[int, Exception], None]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream proposals from a JSONL, CSV or Postgres COPY text file.
+    Rows that fail to parse are passed to on_error(line_number, error) and skipped;
+    without on_error the error is raised.
+    """
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if input_format == "csv":
+            reader = csv.DictReader(f)
+            rows = ((reader.line_num, row) for row in reader)
+        else:
+            rows = ((line_number, line) for line_number, line in enumerate(f, 1) if line.strip())
+
+        for line_number, raw in rows:
+            try:
+                proposal = _normalize_record(_parse_row(raw, input_format))
+            except (ValueError, TypeError, AttributeError) as e:
+                if on_error is None:
+                    raise
+                on_error(line_number, e)
+                continue
+            if proposal is not None:
+                yield proposal
+
+
+def _detect_input_format(path: str) -> str:
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".jsonl", ".ndjson", ".json"):
+        return "jsonl"
+    if ext == ".csv":
+        return "csv"
+    return "copy"
+
+
+# ---------------------------------------------------------------------------
+# Worker side: one AnalysisPipeline per process, models loaded once
+# ---------------------------------------------------------------------------
+
+_worker_pipeline = None
+
+
+def _init_worker(threads_per_worker: int = 1):
+    global _worker_pipeline
+
+    # N worker processes each running torch with its default N intra-op threads oversubscribes
+    # the CPU; pin the thread pools before torch is imported by the agents
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ[var] = str(threads_per_worker)
+    try:
+        import torch
+        torch.set_num_threads(threads_per_worker)
+    except ImportError:
+        pass
+
+    from dotenv import load_dotenv
+    from agents.pipeline import AnalysisPipeline
+
+    load_dotenv()
+    _worker_pipeline = AnalysisPipeline()
+
+
+async def _run_batch(batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    results = []
+    for proposal in batch:
+        try:
+            result = await _worker_pipeline.run(**proposal)
+            results.append({"ok": True, "result": result})
+        except Exception as e:
+            results.append({"ok": False, "proposal_id": proposal["proposal_id"], "error": str(e)})
+    return results
+
+
+def _analyze_batch(batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return asyncio.run(_run_batch(batch))
+
+
+# ---------------------------------------------------------------------------
+# Main process side: writers, checkpoint, progress
+# ---------------------------------------------------------------------------
+
+def to_ai_analysis_row(result: Dict[str, Any], analysis_type: str = "Full") -> Dict[str, Any]:
+    """Convert a pipeline result into the AIAnalysis column layout"""
+    return {
+        "ProposalId": result["proposal_id"],
+        "AnalysisType": analysis_type,
+        "RiskScore": result["risk_score"],
+        "FraudProbability": result["fraud_probability"],
+        "SentimentScore": result["sentiment_score"],
+        "RecommendedAction": result["recommended_action"],
+        "ConfidenceLevel": result["confidence_level"],
+        "KeyInsights": result["key_insights"],
+        "DetailedAnalysis": result["detailed_analysis"],
+        "ModelUsed": result["model_used"],
+        "ProcessingTime": result["processing_time"],
+        "CreatedAt": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+class JsonlResultWriter:
+    """Appends one AIAnalysis row per line; every row is durable once written"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._truncate_partial_line()
+        self.file = open(path, "a", encoding="utf-8")
+
+    def _truncate_partial_line(self):
+        """Drop a trailing line left half-written by a crash"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb+") as f:
+            data = f.read()
+            if data and not data.endswith(b"\n"):
+                f.truncate(data.rfind(b"\n") + 1)
+
+    def written_ids(self) -> Set[int]:
+        """Proposal ids already in the output file (used to reconcile the checkpoint)"""
+        ids = set()
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    ids.add(int(json.loads(line)["ProposalId"]))
+        return ids
+
+    def write(self, rows: List[Dict[str, Any]]) -> List[int]:
+        for row in rows:
+            self.file.write(json.dumps(row) + "\n")
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        return [row["ProposalId"] for row in rows]
+
+    def flush(self) -> List[int]:
+        return []
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetResultWriter:
+    """Buffers rows and writes them as numbered part files inside the output directory"""
+
+    def __init__(self, path: str, rows_per_file: int = 5000):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise RuntimeError("Parquet output requires pyarrow (pip install pyarrow)")
+
+        self.pa = pyarrow
+        self.pq = pyarrow.parquet
+        self.path = path
+        self.rows_per_file = rows_per_file
+        self.buffer: List[Dict[str, Any]] = []
+
+        os.makedirs(path, exist_ok=True)
+        self.part = len([name for name in os.listdir(path) if name.endswith(".parquet")])
+
+    def write(self, rows: List[Dict[str, Any]]) -> List[int]:
+        self.buffer.extend(rows)
+        if len(self.buffer) >= self.rows_per_file:
+            return self.flush()
+        return []
+
+    def flush(self) -> List[int]:
+        if not self.buffer:
+            return []
+
+        table = self.pa.Table.from_pylist(self.buffer)
+        part_path = os.path.join(self.path, f"part-{self.part:05d}.parquet")
+        self.pq.write_table(table.select(AI_ANALYSIS_COLUMNS), part_path + ".tmp")
+        os.replace(part_path + ".tmp", part_path)
+        self.part += 1
+
+        ids = [row["ProposalId"] for row in self.buffer]
+        self.buffer = []
+        return ids
+
+    def written_ids(self) -> Set[int]:
+        """Proposal ids already in finished part files (used to reconcile the checkpoint)"""
+        ids = set()
+        for name in os.listdir(self.path):
+            if name.endswith(".parquet"):
+                table = self.pq.read_table(os.path.join(self.path, name), columns=["ProposalId"])
+                ids.update(int(pid) for pid in table.column("ProposalId").to_pylist())
+        return ids
+
+    def close(self):
+        self.flush()
+
+
+class Checkpoint:
+    """Append-only log of proposal ids whose results have been durably written"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.done: Set[int] = set()
+
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self.done = {int(line) for line in f if line.strip()}
+
+        self.file = open(path, "a", encoding="utf-8")
+
+    def mark(self, proposal_ids: List[int]):
+        if not proposal_ids:
+            return
+        self.file.write("".join(f"{pid}\n" for pid in proposal_ids))
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.done.update(proposal_ids)
+
+    def close(self):
+        self.file.close()
+
+
+class ProgressReporter:
+    """Periodically prints throughput to stderr"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.start = time.time()
+        self.last_report = self.start
+        self.processed = 0
+        self.failed = 0
+        self.skipped = 0  # input rows already in the checkpoint
+        self.analysis_ms = 0
+
+    def record(self, processed: int, failed: int, analysis_ms: int):
+        self.processed += processed
+        self.failed += failed
+        self.analysis_ms += analysis_ms
+
+        now = time.time()
+        if now - self.last_report >= self.interval:
+            self.last_report = now
+            self.report()
+
+    def skip(self):
+        self.skipped += 1
+
+    def report(self, final: bool = False):
+        elapsed = max(time.time() - self.start, 1e-9)
+        rate = self.processed / elapsed
+        avg_ms = self.analysis_ms / self.processed if self.processed else 0
+        label = "done" if final else "progress"
+        print(
+            f"[backfill] {label}: {self.processed} scored, {self.failed} failed, "
+            f"{self.skipped} skipped (checkpoint), {rate:.1f} proposals/s, "
+            f"{avg_ms:.0f} ms avg analysis, {elapsed:.0f}s elapsed",
+            file=sys.stderr,
+            flush=True
+        )
+
+
+def reconcile_checkpoint(checkpoint: Checkpoint, writer) -> List[int]:
+    """
+    Mark rows written just before a crash but not yet checkpointed as done,
+    so a resume never writes them twice. Returns the ids that were added.
+    """
+    missing = sorted(writer.written_ids() - checkpoint.done)
+    checkpoint.mark(missing)
+    return missing
+
+
+def _iter_batches(
+    proposals: Iterator[Dict[str, Any]],
+    done: Set[int],
+    batch_size: int,
+    on_skip: Optional[Callable[[], None]] = None
+) -> Iterator[List[Dict[str, Any]]]:
+    batch = []
+    for proposal in proposals:
+        if proposal["proposal_id"] in done:
+            if on_skip is not None:
+                on_skip()
+            continue
+        batch.append(proposal)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def run_backfill(args: argparse.Namespace) -> int:
+    input_format = args.input_format or _detect_input_format(args.input)
+    checkpoint_path = args.checkpoint or f"{args.output.rstrip(os.sep)}.checkpoint"
+
+    if args.fresh:
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        if args.output_format == "jsonl" and os.path.exists(args.output):
+            os.remove(args.output)
+        elif args.output_format == "parquet" and os.path.isdir(args.output):
+            for name in os.listdir(args.output):
+                if name.startswith("part-") and name.endswith(".parquet"):
+                    os.remove(os.path.join(args.output, name))
+
+    checkpoint = Checkpoint(checkpoint_path)
+    if args.output_format == "parquet":
+        writer = ParquetResultWriter(args.output, rows_per_file=args.rows_per_file)
+    else:
+        writer = JsonlResultWriter(args.output)
+
+    reconcile_checkpoint(checkpoint, writer)
+
+    progress = ProgressReporter(args.report_interval)
+
+    def on_parse_error(line_number: int, error: Exception):
+        print(f"[backfill] {args.input}:{line_number} skipped, could not parse: {error}", file=sys.stderr)
+        progress.record(0, 1, 0)
+
+    proposals = iter_proposals(args.input, input_format, on_error=on_parse_error)
+    batches = _iter_batches(proposals, checkpoint.done, args.batch_size, on_skip=progress.skip)
+    max_in_flight = args.workers * 2
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=args.workers,
+            initializer=_init_worker,
+            initargs=(args.threads_per_worker,)
+        ) as pool:
+            in_flight = set()
+            exhausted = False
+
+            while in_flight or not exhausted:
+                # Keep a bounded number of batches queued so the input is streamed, not loaded
+                while not exhausted and len(in_flight) < max_in_flight:
+                    batch = next(batches, None)
+                    if batch is None:
+                        exhausted = True
+                    else:
+                        in_flight.add(pool.submit(_analyze_batch, batch))
+
+                if not in_flight:
+                    break
+
+                completed, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in completed:
+                    outcomes = future.result()
+                    rows = [to_ai_analysis_row(o["result"], args.analysis_type) for o in outcomes if o["ok"]]
+                    failures = [o for o in outcomes if not o["ok"]]
+
+                    for failure in failures:
+                        print(f"[backfill] proposal {failure['proposal_id']} failed: {failure['error']}", file=sys.stderr)
+
+                    checkpoint.mark(writer.write(rows))
+                    progress.record(len(rows), len(failures), sum(row["ProcessingTime"] for row in rows))
+
+        checkpoint.mark(writer.flush())
+    finally:
+        writer.close()
+        checkpoint.close()
+
+    progress.report(final=True)
+    return 1 if progress.failed else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Re-score historical proposals with the AI agents and write AIAnalysis rows"
+    )
+    parser.add_argument("input", help="Proposals as JSONL, CSV or a Postgres COPY text export")
+    parser.add_argument("output", help="Output JSONL file, or directory for Parquet part files")
+    parser.add_argument("--input-format", choices=["jsonl", "csv", "copy"], help="Defaults to the input file extension")
+    parser.add_argument("--output-format", choices=["jsonl", "parquet"], default="jsonl")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes (default: CPU count)")
+    parser.add_argument("--threads-per-worker", type=int, default=1, help="torch/OpenMP threads per worker process")
+    parser.add_argument("--batch-size", type=int, default=32, help="Proposals per task sent to a worker")
+    parser.add_argument("--rows-per-file", type=int, default=5000, help="Rows per Parquet part file")
+    parser.add_argument("--analysis-type", default="Full", help="AnalysisType value stamped into every row")
+    parser.add_argument("--checkpoint", help="Checkpoint file (default: <output>.checkpoint)")
+    parser.add_argument("--fresh", action="store_true", help="Ignore an existing checkpoint and start over")
+    parser.add_argument("--report-interval", type=float, default=10.0, help="Seconds between progress reports")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return run_backfill(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,207 @@
+"""
+Open-loop load driver for the AI agent service.
+
+Replays a realistic proposal mix against /api/analyze at one or more target request
+rates and reports throughput, latency percentiles, analysis tier / rule-based fallback
+rates and the first rate at which the service saturates.
+
+Usage:
+    python -m loadtest.driver --url http://127.0.0.1:8000 --rps 5,10,20,40 --duration 30
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+# (weight, proposal_type, amount range, description template)
+PROPOSAL_MIX = [
+    (0.35, "Climate", (5000, 60000),
+     "Fund a community solar installation that will improve energy independence and support sustainable growth. "
+     "The project is transparent, with quarterly progress reports and an innovative maintenance plan. "),
+    (0.25, "Treasury", (50000, 250000),
+     "Allocate treasury funds to a diversified strategy. The committee will review allocations monthly "
+     "and publish results to the community. There is some market risk and we address each concern below. "),
+    (0.20, "Technical", (1000, 40000),
+     "Upgrade the governance contracts to reduce gas costs and develop better tooling. This solution will enhance "
+     "security and help contributors. Audits are scheduled before deployment. "),
+    (0.10, "Governance", (0, 5000),
+     "Adjust the quorum requirement. "),
+    (0.10, "Treasury", (100000, 500000),
+     "Guaranteed returns of 300% profit with no risk! Act now, limited offer. Send money by wire transfer to an "
+     "offshore account to double your money. "),
+]
+
+
+def make_proposal(rng: random.Random, proposal_id: int) -> Dict[str, Any]:
+    roll = rng.random()
+    cumulative = 0.0
+    for weight, proposal_type, (low, high), template in PROPOSAL_MIX:
+        cumulative += weight
+        if roll <= cumulative:
+            break
+
+    # Vary length so some requests hit multiple transformer chunks
+    description = template * rng.choice([1, 2, 4, 8, 16])
+    return {
+        "proposal_id": proposal_id,
+        "title": f"Load test proposal {proposal_id} ({proposal_type})",
+        "description": description,
+        "proposal_type": proposal_type,
+        "requested_amount": round(rng.uniform(low, high), 2),
+        "submitter_address": f"0x{rng.getrandbits(160):040x}",
+        "analysis_type": "Full"
+    }
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(round(pct / 100 * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+async def _send(client: httpx.AsyncClient, proposal: Dict[str, Any], results: List[Dict[str, Any]]):
+    start = time.perf_counter()
+    try:
+        response = await client.post("/api/analyze", json=proposal)
+        latency_ms = (time.perf_counter() - start) * 1000
+        if response.status_code == 200:
+            body = response.json()
+            results.append({
+                "ok": True,
+                "latency_ms": latency_ms,
+                "tier": body.get("analysis_tier", "full"),
+                "method": body.get("recommendation_method")
+            })
+        else:
+            results.append({"ok": False, "latency_ms": latency_ms, "error": f"HTTP {response.status_code}"})
+    except httpx.HTTPError as e:
+        results.append({"ok": False, "latency_ms": (time.perf_counter() - start) * 1000, "error": type(e).__name__})
+
+
+async def _load_stats(client: httpx.AsyncClient) -> Optional[Dict[str, Any]]:
+    try:
+        response = await client.get("/api/load")
+        return response.json() if response.status_code == 200 else None
+    except httpx.HTTPError:
+        return None
+
+
+async def run_step(client: httpx.AsyncClient, rps: float, duration: float, rng: random.Random, next_id: int) -> Dict[str, Any]:
+    """Fire requests on a fixed schedule (open loop) regardless of how fast the service answers"""
+    before = await _load_stats(client)
+    results: List[Dict[str, Any]] = []
+    tasks = []
+    interval = 1 / rps
+    total = int(rps * duration)
+
+    start = time.perf_counter()
+    for i in range(total):
+        delay = start + i * interval - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(_send(client, make_proposal(rng, next_id + i), results)))
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+    after = await _load_stats(client)
+
+    ok = [r for r in results if r["ok"]]
+    latencies = sorted(r["latency_ms"] for r in ok)
+    tiers = Counter(r["tier"] for r in ok)
+    degraded = sum(count for tier, count in tiers.items() if tier != "full")
+    # Recommendations that came from _analyze_with_rules instead of the LLM, for any reason
+    rules_fallbacks = sum(1 for r in ok if r["method"] == "rules")
+
+    # Requests the load shedder admitted below full (assumes the driver is the service's only client)
+    shed = None
+    if before and after:
+        shed = sum(
+            after["admitted_by_tier"].get(tier, 0) - before["admitted_by_tier"].get(tier, 0)
+            for tier in after["admitted_by_tier"] if tier != "full"
+        )
+
+    return {
+        "target_rps": rps,
+        "sent": total,
+        "achieved_rps": len(ok) / elapsed if elapsed else 0.0,
+        "errors": len(results) - len(ok),
+        "error_kinds": Counter(r["error"] for r in results if not r["ok"]),
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+        "max_ms": latencies[-1] if latencies else 0.0,
+        "tiers": dict(tiers),
+        "degraded_rate": degraded / len(ok) if ok else 0.0,
+        "shed_rate": (shed / len(ok) if ok else 0.0) if shed is not None else None,
+        "rules_fallback_rate": rules_fallbacks / len(ok) if ok else 0.0,
+    }
+
+
+def print_step(step: Dict[str, Any]):
+    shed = "n/a" if step["shed_rate"] is None else f"{step['shed_rate']:.1%}"
+    fallback = f"{step['rules_fallback_rate']:.1%}"
+    print(
+        f"{step['target_rps']:>7.1f} {step['achieved_rps']:>9.1f} {step['sent']:>6} {step['errors']:>6} "
+        f"{step['p50_ms']:>8.0f} {step['p95_ms']:>8.0f} {step['p99_ms']:>8.0f} "
+        f"{step['degraded_rate']:>9.1%} {shed:>7} {fallback:>9}  {step['tiers']}"
+    )
+    if step["error_kinds"]:
+        print(f"        errors: {dict(step['error_kinds'])}")
+
+
+def is_saturated(step: Dict[str, Any], slo_ms: float) -> bool:
+    return (
+        step["achieved_rps"] < 0.9 * step["target_rps"]
+        or step["p95_ms"] > slo_ms
+        or step["errors"] > 0.01 * step["sent"]
+    )
+
+
+async def run(args: argparse.Namespace):
+    rng = random.Random(args.seed)
+    limits = httpx.Limits(max_connections=args.max_connections, max_keepalive_connections=args.max_connections)
+
+    async with httpx.AsyncClient(base_url=args.url, timeout=args.timeout, limits=limits) as client:
+        print(f"{'target':>7} {'achieved':>9} {'sent':>6} {'errors':>6} {'p50':>8} {'p95':>8} {'p99':>8} "
+              f"{'degraded':>9} {'shed':>7} {'fallback':>9}  tiers")
+
+        saturation = None
+        next_id = 1
+        for rps in args.rps:
+            step = await run_step(client, rps, args.duration, rng, next_id)
+            next_id += step["sent"]
+            print_step(step)
+            if saturation is None and is_saturated(step, args.slo_ms):
+                saturation = rps
+                if args.stop_at_saturation:
+                    break
+
+        if saturation is None:
+            print(f"\nNo saturation up to {args.rps[-1]} rps (p95 SLO {args.slo_ms:.0f} ms)")
+        else:
+            print(f"\nSaturated at {saturation} rps (throughput < 90% of target, p95 > {args.slo_ms:.0f} ms or > 1% errors)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Open-loop load driver for /api/analyze")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--rps", default="5,10,20", help="Comma-separated target rates, run in order")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds per rate step")
+    parser.add_argument("--slo-ms", type=float, default=2000.0, help="p95 latency considered saturated")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--max-connections", type=int, default=500)
+    parser.add_argument("--stop-at-saturation", action="store_true")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    args.rps = [float(r) for r in args.rps.split(",") if r.strip()]
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+Local OpenAI-compatible stub for load testing without spending quota.
+
+Serves POST /v1/chat/completions (streaming and non-streaming) with a configurable
+latency distribution, error rate and token streaming speed. Replies follow the
+RECOMMENDATION / CONFIDENCE / KEY_INSIGHTS / DETAILED_ANALYSIS format that
+ProposalAnalyzer parses, derived deterministically from the prompt.
+
+Usage:
+    python -m loadtest.fake_llm --port 8100 --latency-ms 1500 --latency-sigma 0.4 --error-rate 0.02
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import re
+import time
+import uuid
+from typing import Any, Dict
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+
+class FakeLLMConfig:
+    def __init__(
+        self,
+        latency_ms: float = 1500.0,
+        latency_sigma: float = 0.4,
+        latency_dist: str = "lognormal",
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        tokens_per_second: float = 50.0,
+        seed: int = 0
+    ):
+        self.latency_ms = latency_ms
+        self.latency_sigma = latency_sigma
+        self.latency_dist = latency_dist
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.tokens_per_second = tokens_per_second
+        self.rng = random.Random(seed)
+
+    def sample_latency(self) -> float:
+        """Time to first token, in seconds"""
+        if self.latency_dist == "fixed":
+            ms = self.latency_ms
+        elif self.latency_dist == "uniform":
+            spread = self.latency_ms * self.latency_sigma
+            ms = self.rng.uniform(self.latency_ms - spread, self.latency_ms + spread)
+        else:
+            # latency_ms is the median of the lognormal
+            ms = self.latency_ms * self.rng.lognormvariate(0, self.latency_sigma)
+        return max(ms, 0) / 1000
+
+
+def _score(prompt: str, label: str) -> float:
+    match = re.search(rf"{label}:\s*(-?[\d.]+)", prompt)
+    return float(match.group(1)) if match else 0.0
+
+
+def build_reply(prompt: str) -> str:
+    """Deterministic analysis text for a given prompt"""
+    risk = _score(prompt, "Risk Score")
+    fraud = _score(prompt, "Fraud Probability")
+    sentiment = _score(prompt, "Sentiment Score")
+    digest = int(hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:8], 16)
+
+    if fraud > 70:
+        recommendation = "Reject"
+    elif risk < 40 and fraud < 30 and sentiment > 30:
+        recommendation = "Approve"
+    else:
+        recommendation = "Review"
+
+    return "\n".join([
+        f"RECOMMENDATION: {recommendation}",
+        f"CONFIDENCE: {60 + digest % 35}",
+        "KEY_INSIGHTS:",
+        f"- Risk score of {risk:.1f} considered against the requested amount",
+        f"- Fraud probability of {fraud:.1f} from automated screening",
+        f"- Sentiment score of {sentiment:+.1f} from proposal text",
+        "DETAILED_ANALYSIS:",
+        " ".join(["This is a stubbed analysis generated by the local fake LLM for load testing."] * 6),
+    ])
+
+
+def create_app(config: FakeLLMConfig) -> FastAPI:
+    app = FastAPI(title="Fake OpenAI-compatible LLM")
+    stats = {"requests": 0, "completed": 0, "errors": 0, "rate_limited": 0, "streamed": 0}
+
+    def _error(status: int, message: str, error_type: str) -> JSONResponse:
+        return JSONResponse(status_code=status, content={"error": {"message": message, "type": error_type}})
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body: Dict[str, Any] = await request.json()
+        stats["requests"] += 1
+
+        roll = config.rng.random()
+        if roll < config.rate_limit_rate:
+            stats["rate_limited"] += 1
+            return _error(429, "Rate limit reached (fake)", "rate_limit_error")
+        if roll < config.rate_limit_rate + config.error_rate:
+            await asyncio.sleep(config.sample_latency())
+            stats["errors"] += 1
+            return _error(500, "Internal server error (fake)", "server_error")
+
+        prompt = "\n".join(str(m.get("content", "")) for m in body.get("messages", []))
+        reply = build_reply(prompt)
+        model = body.get("model", "gpt-4")
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        created = int(time.time())
+        tokens = re.findall(r"\S+\s*", reply)
+
+        await asyncio.sleep(config.sample_latency())
+
+        if body.get("stream"):
+            stats["streamed"] += 1
+
+            async def events():
+                delay = 1 / config.tokens_per_second if config.tokens_per_second > 0 else 0
+                for token in tokens:
+                    chunk = {
+                        "id": completion_id, "object": "chat.completion.chunk", "created": created, "model": model,
+                        "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}]
+                    }
+                    yield f"data: {json.dumps(chunk)}\n\n"
+                    if delay:
+                        await asyncio.sleep(delay)
+                final = {
+                    "id": completion_id, "object": "chat.completion.chunk", "created": created, "model": model,
+                    "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]
+                }
+                yield f"data: {json.dumps(final)}\n\n"
+                yield "data: [DONE]\n\n"
+                stats["completed"] += 1
+
+            return StreamingResponse(events(), media_type="text/event-stream")
+
+        # Non-streaming callers still wait for the whole generation
+        if config.tokens_per_second > 0:
+            await asyncio.sleep(len(tokens) / config.tokens_per_second)
+        stats["completed"] += 1
+
+        return {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": created,
+            "model": model,
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": reply}, "finish_reason": "stop"}],
+            "usage": {
+                "prompt_tokens": len(prompt.split()),
+                "completion_tokens": len(tokens),
+                "total_tokens": len(prompt.split()) + len(tokens)
+            }
+        }
+
+    @app.get("/v1/models")
+    async def models():
+        return {"object": "list", "data": [{"id": "gpt-4", "object": "model", "owned_by": "fake-llm"}]}
+
+    @app.get("/stats")
+    async def get_stats():
+        return stats
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local OpenAI-compatible stub server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--latency-ms", type=float, default=1500.0, help="Median time to first token")
+    parser.add_argument("--latency-sigma", type=float, default=0.4, help="Lognormal sigma, or relative spread for uniform")
+    parser.add_argument("--latency-dist", choices=["lognormal", "uniform", "fixed"], default="lognormal")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with HTTP 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of requests answered with HTTP 429")
+    parser.add_argument("--tokens-per-second", type=float, default=50.0, help="Generation speed; 0 returns instantly")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    config = FakeLLMConfig(
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        latency_dist=args.latency_dist,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        tokens_per_second=args.tokens_per_second,
+        seed=args.seed
+    )
+
+    import uvicorn
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+The real `api.main` app with model stand-ins wired in, for load testing.
+
+The sentiment transformer is replaced by StubSentimentPipeline and the GPT-4 client
+is pointed at the local fake LLM, so everything else (load shedding, serialization,
+the agents themselves) runs exactly as in production.
+
+Usage:
+    FAKE_LLM_URL=http://127.0.0.1:8100/v1 STUB_SENTIMENT_LATENCY_MS=40 \\
+        uvicorn loadtest.stub_app:app --port 8000
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import agents.proposal_analyzer as proposal_analyzer_module
+import agents.sentiment_analyzer as sentiment_analyzer_module
+from api import main
+from loadtest.stub_models import StubSentimentPipeline
+
+app = main.app
+
+FAKE_LLM_URL = os.getenv("FAKE_LLM_URL", "http://127.0.0.1:8100/v1")
+
+sentiment_analyzer_module.TRANSFORMERS_AVAILABLE = True
+main.sentiment_analyzer.sentiment_pipeline = StubSentimentPipeline(
+    latency_ms=float(os.getenv("STUB_SENTIMENT_LATENCY_MS", "40"))
+)
+
+if proposal_analyzer_module.LANGCHAIN_AVAILABLE and FAKE_LLM_URL:
+    main.proposal_analyzer.llm = proposal_analyzer_module.ChatOpenAI(
+        model="gpt-4",
+        temperature=0.7,
+        openai_api_key="sk-fake-llm",
+        openai_api_base=FAKE_LLM_URL,
+        max_retries=int(os.getenv("FAKE_LLM_MAX_RETRIES", "0"))
+    )
+    main.proposal_analyzer.use_openai = True
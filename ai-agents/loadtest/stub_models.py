@@ -0,0 +1,36 @@
+import hashlib
+import time
+from typing import Any, Dict, List, Union
+
+
+class StubSentimentPipeline:
+    """
+    Deterministic stand-in for the transformers sentiment-analysis pipeline.
+    Same call signature and output shape; the label and score are derived from a
+    hash of the text, and `latency_ms` of CPU time is burned per text to mimic
+    DistilBERT inference cost (it holds the CPU just like the real model).
+    """
+
+    def __init__(self, latency_ms: float = 40.0):
+        self.latency_ms = latency_ms
+        self.calls = 0
+
+    def _classify(self, text: str) -> Dict[str, Any]:
+        digest = int(hashlib.sha256(text.encode("utf-8")).hexdigest()[:8], 16)
+        label = "POSITIVE" if digest % 3 else "NEGATIVE"
+        score = 0.5 + (digest % 5000) / 10000
+        return {"label": label, "score": round(score, 4)}
+
+    def _burn(self):
+        deadline = time.perf_counter() + self.latency_ms / 1000
+        while time.perf_counter() < deadline:
+            pass
+
+    def __call__(self, inputs: Union[str, List[str]], **kwargs) -> List[Dict[str, Any]]:
+        texts = [inputs] if isinstance(inputs, str) else list(inputs)
+        self.calls += len(texts)
+        results = []
+        for text in texts:
+            self._burn()
+            results.append(self._classify(text))
+        return results
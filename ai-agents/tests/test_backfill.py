@@ -0,0 +1,112 @@
+import json
+
+import pytest
+
+from cli.backfill import (
+    Checkpoint, JsonlResultWriter, _decode_copy_field, _iter_batches, iter_proposals, reconcile_checkpoint
+)
+
+
+def row(proposal_id: int) -> dict:
+    return {"ProposalId": proposal_id, "RiskScore": 10.0}
+
+
+def read_ids(path) -> list:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line)["ProposalId"] for line in f]
+
+
+@pytest.mark.parametrize("raw, decoded", [
+    ("plain", "plain"),
+    ("\\N", None),
+    ("tab\\there", "tab\there"),
+    ("line\\nbreak\\\\", "line\nbreak\\"),
+    ("\\q", "q"),
+])
+def test_decode_copy_field(raw, decoded):
+    assert _decode_copy_field(raw) == decoded
+
+
+def test_parse_errors_are_reported_with_line_numbers_and_skipped(tmp_path):
+    path = tmp_path / "proposals.jsonl"
+    path.write_text("\n".join([
+        json.dumps({"ProposalId": 1, "Description": "ok"}),
+        json.dumps({"ProposalId": "abc", "Description": "bad id"}),
+        "",
+        json.dumps({"ProposalId": 3, "Description": "bad amount", "RequestedAmount": "n/a"}),
+        "{not json",
+        json.dumps({"ProposalId": 5, "Description": "ok", "RequestedAmount": "12.5"}),
+    ]) + "\n", encoding="utf-8")
+
+    errors = []
+    proposals = list(iter_proposals(str(path), "jsonl", on_error=lambda line, e: errors.append(line)))
+
+    assert [p["proposal_id"] for p in proposals] == [1, 5]
+    assert proposals[1]["requested_amount"] == 12.5
+    assert errors == [2, 4, 5]
+
+    with pytest.raises(ValueError):
+        list(iter_proposals(str(path), "jsonl"))
+
+
+def test_csv_line_numbers_account_for_multiline_fields(tmp_path):
+    path = tmp_path / "proposals.csv"
+    path.write_text('ProposalId,Description\n1,"two\nlines"\nabc,bad\n', encoding="utf-8")
+
+    errors = []
+    proposals = list(iter_proposals(str(path), "csv", on_error=lambda line, e: errors.append(line)))
+
+    assert [p["description"] for p in proposals] == ["two\nlines"]
+    assert errors == [4]
+
+
+def test_copy_input(tmp_path):
+    path = tmp_path / "proposals.copy"
+    fields = ["7", "\\N", "Title", "multi\\nline", "Treasury", "100.5"] + ["\\N"] * 10
+    path.write_text("\t".join(fields) + "\n", encoding="utf-8")
+
+    [proposal] = iter_proposals(str(path), "copy")
+    assert proposal["proposal_id"] == 7
+    assert proposal["description"] == "multi\nline"
+    assert proposal["requested_amount"] == 100.5
+
+
+def test_half_written_line_is_truncated_on_open(tmp_path):
+    path = tmp_path / "results.jsonl"
+    path.write_text(json.dumps(row(1)) + "\n" + '{"ProposalId": 2, "Ri', encoding="utf-8")
+
+    writer = JsonlResultWriter(str(path))
+    writer.write([row(3)])
+    writer.close()
+
+    assert read_ids(path) == [1, 3]
+
+
+def test_resume_marks_written_but_uncheckpointed_rows(tmp_path):
+    output = tmp_path / "results.jsonl"
+    checkpoint_path = tmp_path / "results.jsonl.checkpoint"
+
+    # Crash after the writer fsynced rows 1-3 but before the checkpoint recorded 3
+    writer = JsonlResultWriter(str(output))
+    writer.write([row(1), row(2), row(3)])
+    writer.close()
+    checkpoint = Checkpoint(str(checkpoint_path))
+    checkpoint.mark([1, 2])
+    checkpoint.close()
+
+    writer = JsonlResultWriter(str(output))
+    checkpoint = Checkpoint(str(checkpoint_path))
+    assert reconcile_checkpoint(checkpoint, writer) == [3]
+    assert reconcile_checkpoint(checkpoint, writer) == []
+
+    proposals = [{"proposal_id": i} for i in range(1, 6)]
+    skipped = []
+    batches = list(_iter_batches(iter(proposals), checkpoint.done, 10, on_skip=lambda: skipped.append(1)))
+    writer.close()
+    checkpoint.close()
+
+    assert [[p["proposal_id"] for p in batch] for batch in batches] == [[4, 5]]
+    assert len(skipped) == 3
+    reopened = Checkpoint(str(checkpoint_path))
+    reopened.close()
+    assert reopened.done == {1, 2, 3}
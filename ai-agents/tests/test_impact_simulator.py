@@ -0,0 +1,51 @@
+import pytest
+
+from agents.impact_simulator import ImpactSimulator
+
+PARAMS = dict(proposal_id=7, requested_amount=75000.0, treasury_balance=1_000_000.0, monthly_spend=30000.0)
+
+
+def test_runs_are_reproducible():
+    simulator = ImpactSimulator()
+    first = simulator.run(time_budget_ms=float("inf"), **PARAMS)
+    second = simulator.run(time_budget_ms=float("inf"), **PARAMS)
+
+    assert first["scenarios_tested"] == 20000
+    assert first["success_probability"] == second["success_probability"]
+    assert first["simulation_data"]["final_treasury_if_executed"] == second["simulation_data"]["final_treasury_if_executed"]
+
+
+def test_long_horizon_chunks_fit_the_budget():
+    simulator = ImpactSimulator(cells_per_chunk=60000)
+    result = simulator.run(horizon_months=3000, time_budget_ms=1e-6, **PARAMS)
+
+    assert result["simulation_data"]["horizon_months"] == simulator.max_horizon_months
+    # The budget is checked after every chunk, and a chunk is capped at cells_per_chunk cells
+    assert result["scenarios_tested"] == 60000 // simulator.max_horizon_months
+    assert result["simulation_data"]["budget_exhausted"]
+
+
+@pytest.mark.parametrize("scenarios", [-3, 1])
+def test_tiny_scenario_counts_still_simulate(scenarios):
+    result = ImpactSimulator().run(scenarios=scenarios, **PARAMS)
+    assert result["scenarios_tested"] == 1
+
+
+def test_request_above_treasury_is_capped_and_a_certain_shortfall():
+    result = ImpactSimulator().run(
+        proposal_id=7, requested_amount=2_000_000.0, treasury_balance=1_000_000.0, token_volatility=2.0
+    )
+    data = result["simulation_data"]
+
+    assert not data["fundable"]
+    assert data["shortfall_probability"] == 100.0
+    # Paying out the whole treasury leaves nothing, whatever the token price does
+    assert data["final_treasury_if_executed"]["p5"] == 0.0
+    assert data["final_treasury_if_executed"]["p95"] == 0.0
+    assert data["final_treasury_if_rejected"]["p50"] > 0
+
+
+def test_fundable_request():
+    result = ImpactSimulator().run(**PARAMS)
+    assert result["simulation_data"]["fundable"]
+    assert result["simulation_data"]["final_treasury_if_executed"]["p5"] > 0
@@ -0,0 +1,72 @@
+import asyncio
+import time
+
+from agents.pipeline import TIER_FULL
+from agents.sentiment_analyzer import SentimentAnalyzer
+import agents.sentiment_analyzer as sentiment_module
+from api.load_shedding import AdaptiveLoadShedder
+from loadtest.stub_models import StubSentimentPipeline
+
+
+def stub_analyzer(monkeypatch, latency_ms: float) -> SentimentAnalyzer:
+    """SentimentAnalyzer whose "DistilBERT" burns latency_ms of CPU per text"""
+    monkeypatch.setattr(sentiment_module, "TRANSFORMERS_AVAILABLE", False)
+    analyzer = SentimentAnalyzer()
+    analyzer.sentiment_pipeline = StubSentimentPipeline(latency_ms=latency_ms)
+    monkeypatch.setattr(sentiment_module, "TRANSFORMERS_AVAILABLE", True)
+    return analyzer
+
+
+def test_degrades_under_cpu_bound_model_load(monkeypatch):
+    analyzer = stub_analyzer(monkeypatch, latency_ms=40)
+
+    shedder = AdaptiveLoadShedder(slo_ms=100, max_concurrency=8, degrade_cooldown_s=0)
+
+    async def request(i: int):
+        arrived_at = time.monotonic()
+        async with shedder.admit(arrived_at) as tier:
+            result = await analyzer.analyze(f"proposal {i}", use_model=True)
+        return tier, result["model"]
+
+    async def burst():
+        return await asyncio.gather(*(request(i) for i in range(100)))
+
+    results = asyncio.run(burst())
+    stats = shedder.stats()
+
+    assert all(model == "DistilBERT" for _, model in results)
+    assert stats["queue_latency_ms"] > 100
+    assert stats["current_tier"] != TIER_FULL
+    assert any(tier != TIER_FULL for tier, _ in results)
+
+
+def test_model_inference_does_not_block_event_loop(monkeypatch):
+    analyzer = stub_analyzer(monkeypatch, latency_ms=200)
+
+    async def run():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        await analyzer.analyze("a proposal", use_model=True)
+        task.cancel()
+        return ticks
+
+    assert asyncio.run(run()) >= 5
+
+
+def test_queue_latency_counts_time_before_admit():
+    shedder = AdaptiveLoadShedder(slo_ms=100, degrade_cooldown_s=0, smoothing=1.0)
+
+    async def late_request():
+        async with shedder.admit(time.monotonic() - 0.5) as tier:
+            return tier
+
+    asyncio.run(late_request())
+    assert shedder.stats()["queue_latency_ms"] >= 500
+    assert shedder.tier != TIER_FULL
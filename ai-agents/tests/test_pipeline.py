@@ -0,0 +1,156 @@
+import asyncio
+import json
+
+import pytest
+
+from agents.fraud_detector import FraudDetector
+from agents.pipeline import AnalysisPipeline, TIER_FULL, TIER_MINIMAL, TIER_REDUCED
+from agents.proposal_analyzer import ProposalAnalyzer
+import agents.proposal_analyzer as proposal_module
+from agents.risk_assessor import RiskAssessor
+from agents.rules import DEFAULT_RULES_PATH, RuleStore, compile_rules
+from agents.sentiment_analyzer import SentimentAnalyzer
+import agents.sentiment_analyzer as sentiment_module
+from loadtest.stub_models import StubSentimentPipeline
+
+
+class FailingPipeline:
+    def __call__(self, *args, **kwargs):
+        raise RuntimeError("model crashed")
+
+
+def make_pipeline(monkeypatch, sentiment_pipeline) -> AnalysisPipeline:
+    monkeypatch.setattr(sentiment_module, "TRANSFORMERS_AVAILABLE", False)
+    analyzer = SentimentAnalyzer()
+    analyzer.sentiment_pipeline = sentiment_pipeline
+    monkeypatch.setattr(sentiment_module, "TRANSFORMERS_AVAILABLE", True)
+    return AnalysisPipeline(sentiment_analyzer=analyzer)
+
+
+def test_sentiment_tier_reports_keyword_fallback(monkeypatch):
+    pipeline = make_pipeline(monkeypatch, FailingPipeline())
+    result = asyncio.run(pipeline.sentiment_analyzer.analyze("a proposal", use_model=True))
+
+    assert result["model"] == "Keyword-Based"
+    assert pipeline.sentiment_tier(result) == TIER_MINIMAL
+
+
+def test_sentiment_tier_with_model(monkeypatch):
+    pipeline = make_pipeline(monkeypatch, StubSentimentPipeline(latency_ms=0))
+    result = asyncio.run(pipeline.sentiment_analyzer.analyze("a proposal", use_model=True))
+
+    assert result["model"] == "DistilBERT"
+    assert pipeline.sentiment_tier(result) == TIER_FULL
+
+
+@pytest.fixture
+def strict_rules(tmp_path):
+    """Rules where a large Treasury request alone scores above the Review cut-off"""
+    with open(DEFAULT_RULES_PATH, encoding="utf-8") as f:
+        raw = json.load(f)
+    raw["risk"]["amount_thresholds"][-1]["risk"] = 100
+    raw["risk"]["proposal_type_risk"]["Treasury"] = 100
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps(raw), encoding="utf-8")
+    return RuleStore(str(path))
+
+
+def make_rules_pipeline(monkeypatch, rules: RuleStore, early_exit: bool = True) -> AnalysisPipeline:
+    monkeypatch.setattr(sentiment_module, "TRANSFORMERS_AVAILABLE", False)
+    analyzer = SentimentAnalyzer(rules=rules)
+    analyzer.sentiment_pipeline = StubSentimentPipeline(latency_ms=5)
+    monkeypatch.setattr(sentiment_module, "TRANSFORMERS_AVAILABLE", True)
+    return AnalysisPipeline(
+        proposal_analyzer=ProposalAnalyzer(rules=rules),
+        risk_assessor=RiskAssessor(rules=rules),
+        fraud_detector=FraudDetector(rules=rules),
+        sentiment_analyzer=analyzer,
+        rules=rules,
+        early_exit=early_exit
+    )
+
+
+URGENT = "Urgent emergency grant, pay immediately for a quick start"
+
+
+def analyze(pipeline: AnalysisPipeline, proposal_id: int, proposal_type: str, amount: float,
+            tier: str = TIER_FULL, description: str = URGENT):
+    return asyncio.run(pipeline.run(
+        proposal_id=proposal_id,
+        title="Community fund",
+        description=description,
+        proposal_type=proposal_type,
+        requested_amount=amount,
+        submitter_address="0xabc",
+        tier=tier
+    ))
+
+
+def test_early_exit_skips_transformer_once_rules_decide(monkeypatch, strict_rules):
+    pipeline = make_rules_pipeline(monkeypatch, strict_rules)
+    baseline = make_rules_pipeline(monkeypatch, strict_rules, early_exit=False)
+
+    ordinary = analyze(pipeline, 1, "Governance", 500.0,
+                       description="Fund community growth and support local development with transparent reporting")
+    assert ordinary["skipped_stages"] == []
+    assert ordinary["early_exit_reason"] is None
+    calls = pipeline.sentiment_analyzer.sentiment_pipeline.calls
+
+    settled = analyze(pipeline, 2, "Treasury", 500000.0)
+    expected = analyze(baseline, 2, "Treasury", 500000.0)
+
+    assert settled["risk_score"] > strict_rules.current().risk_review_threshold
+    assert settled["skipped_stages"] == ["sentiment_model"]
+    assert "rule-based Review" in settled["early_exit_reason"]
+    assert pipeline.sentiment_analyzer.sentiment_pipeline.calls == calls
+    assert settled["analysis_tier"] == TIER_FULL
+    # Skipping the transformer doesn't change the decision
+    assert settled["recommended_action"] == expected["recommended_action"] == "Review"
+    assert settled["confidence_level"] == expected["confidence_level"]
+    assert expected["skipped_stages"] == []
+
+    stats = pipeline.stats.snapshot()
+    assert stats["runs"] == 2
+    assert stats["early_exits"] == 1
+    assert stats["stages"]["sentiment_model"]["skipped"] == 1
+    assert stats["estimated_saved_ms"] > 0
+
+
+def test_no_early_exit_while_the_llm_decides(monkeypatch, strict_rules):
+    pipeline = make_rules_pipeline(monkeypatch, strict_rules)
+    analyzer = pipeline.proposal_analyzer
+    monkeypatch.setattr(analyzer, "uses_llm", lambda use_llm=True: use_llm)
+
+    async def fake_llm(*args):
+        return {"recommendation": "Approve", "confidence": 80.0, "key_insights": "", "detailed_analysis": "",
+                "model_used": "GPT-4", "method": "llm"}
+    monkeypatch.setattr(analyzer, "_analyze_with_llm", fake_llm)
+    monkeypatch.setattr(proposal_module, "LANGCHAIN_AVAILABLE", True)
+    analyzer.llm = object()
+
+    full = analyze(pipeline, 3, "Treasury", 500000.0)
+    assert full["skipped_stages"] == []
+    assert full["recommendation_method"] == "llm"
+
+    # Shed to reduced, the recommendation is rule-based again, so the exit applies
+    reduced = analyze(pipeline, 4, "Treasury", 500000.0, tier=TIER_REDUCED)
+    assert reduced["skipped_stages"] == ["sentiment_model"]
+    assert reduced["recommendation_method"] == "rules"
+    assert reduced["analysis_tier"] == TIER_REDUCED
+
+
+def test_default_rules_share_cut_offs_with_recommendation():
+    rules = compile_rules({
+        "version": "t",
+        "risk": {"amount_thresholds": [{"max_amount": None, "risk": 10}], "proposal_type_risk": {},
+                 "suspicious_keywords": [], "url_pattern": "x"},
+        "fraud": {"fraud_keywords": [], "suspicious_patterns": []},
+        "sentiment": {"positive_words": [], "negative_words": []}
+    })
+    assert (rules.fraud_reject_threshold, rules.risk_review_threshold) == (70.0, 80.0)
+
+    analyzer = ProposalAnalyzer(rules=RuleStore(DEFAULT_RULES_PATH))
+    assert analyzer.settled_by_rules(50.0, 70.5, rules).endswith("rule-based Reject")
+    assert analyzer.settled_by_rules(80.5, 10.0, rules).endswith("rule-based Review")
+    assert analyzer.settled_by_rules(80.0, 70.0, rules) is None
+    assert analyzer._analyze_with_rules("t", "d", "Governance", 1.0, 50.0, 70.5, 90.0, rules)["recommendation"] == "Reject"
@@ -0,0 +1,48 @@
+import pytest
+
+pytest.importorskip("fastapi")
+
+from api.responses import compress_body, encode_body
+
+
+@pytest.mark.parametrize("accept, media_type", [
+    (None, "application/json"),
+    ("application/msgpack", "application/msgpack"),
+    ("application/json, application/msgpack;q=0.1", "application/json"),
+    ("application/msgpack, application/json;q=0.5", "application/msgpack"),
+    ("application/msgpack;q=0.8, */*;q=0.8", "application/json"),
+    ("application/msgpack;q=0, application/json;q=0.1", "application/json"),
+    ("text/html", "application/json"),
+])
+def test_encode_body_picks_highest_q(accept, media_type):
+    pytest.importorskip("msgpack")
+    _, chosen = encode_body({"proposal_id": 1}, accept)
+    assert chosen == media_type
+
+
+LARGE_BODY = b"x" * 4096
+
+
+@pytest.mark.parametrize("accept_encoding, encoding", [
+    (None, None),
+    ("gzip", "gzip"),
+    ("gzip, zstd;q=0.1", "gzip"),
+    ("gzip;q=0.5, zstd", "zstd"),
+    ("gzip, zstd", "zstd"),
+    ("*", "zstd"),
+    ("gzip;q=0, *;q=0.5", "zstd"),
+    ("identity, gzip;q=0.5", None),
+    ("gzip;q=0, zstd;q=0", None),
+    ("*;q=0, gzip", "gzip"),
+])
+def test_compress_body_picks_highest_q(accept_encoding, encoding):
+    pytest.importorskip("zstandard")
+    body, chosen = compress_body(LARGE_BODY, accept_encoding)
+    assert chosen == encoding
+    assert (body == LARGE_BODY) == (encoding is None)
+
+
+def test_small_body_is_compressed_only_when_identity_is_refused():
+    small = b"x" * 10
+    assert compress_body(small, "gzip")[1] is None
+    assert compress_body(small, "gzip, identity;q=0")[1] == "gzip"
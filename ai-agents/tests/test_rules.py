@@ -0,0 +1,85 @@
+import json
+import logging
+import os
+import shutil
+
+import pytest
+
+from agents.rules import DEFAULT_RULES_PATH, RuleStore
+from agents.sentiment_analyzer import SentimentAnalyzer
+from agents.vote_sentiment import VoteSentimentAggregator
+
+
+@pytest.fixture
+def rules_path(tmp_path):
+    path = str(tmp_path / "rules.json")
+    shutil.copy(DEFAULT_RULES_PATH, path)
+    return path
+
+
+def rewrite(path: str, content: str):
+    mtime = os.path.getmtime(path)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.utime(path, (mtime + 1, mtime + 1))
+
+
+def test_broken_edit_is_logged_once_per_version(rules_path, caplog):
+    store = RuleStore(rules_path)
+    rewrite(rules_path, "{broken")
+
+    with caplog.at_level(logging.ERROR, logger="agents.rules"):
+        first = store.reload(force=False)
+        second = store.reload(force=False)
+
+    assert "error" in first
+    assert "error" not in second
+    assert store.version.startswith("1+")
+    assert len(caplog.records) == 1
+
+
+def load_raw(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_version_changes_with_content(rules_path):
+    store = RuleStore(rules_path)
+    before = store.version
+
+    # Reformatting without changing any rule keeps the version
+    rewrite(rules_path, json.dumps(load_raw(rules_path), indent=4))
+    assert store.reload(force=False)["version"] == before
+
+    # Changing a rule without bumping "version" still yields a new version
+    raw = load_raw(rules_path)
+    raw["sentiment"]["positive_words"].remove("benefit")
+    rewrite(rules_path, json.dumps(raw))
+    result = store.reload(force=False)
+
+    assert result["previous_version"] == before
+    assert result["version"] != before
+    assert result["version"].startswith("1+")
+
+
+@pytest.mark.parametrize("bump_version", [True, False])
+def test_reload_rescores_keyword_vote_reasons(rules_path, bump_version):
+    store = RuleStore(rules_path)
+    aggregator = VoteSentimentAggregator(SentimentAnalyzer(rules=store))
+    result = aggregator.ingest([
+        {"proposal_id": 1, "voter_id": "a", "vote_type": "For", "voting_power": 2, "reason": "a benefit plan"}
+    ], use_model=False)
+
+    assert result["rules_version"] == store.version
+    assert aggregator.current(1)["score"] == 100.0
+    assert aggregator.current(1)["scored_with"] == {f"Keyword-Based@{store.version}": 1}
+
+    raw = load_raw(rules_path)
+    if bump_version:
+        raw["version"] = "2"
+    raw["sentiment"]["positive_words"].remove("benefit")
+    rewrite(rules_path, json.dumps(raw))
+
+    assert store.reload(force=False)["reloaded"]
+    assert aggregator.current(1)["score"] == 0.0
+    assert aggregator.current(1)["scored_with"] == {f"Keyword-Based@{store.version}": 1}
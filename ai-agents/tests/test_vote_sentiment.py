@@ -0,0 +1,76 @@
+import threading
+
+from agents.sentiment_analyzer import SentimentAnalyzer
+from agents.vote_sentiment import VoteSentimentAggregator
+
+
+def vote(voter_id, reason, power=1.0, vote_type="For", created_at=0, proposal_id=1):
+    return {
+        "proposal_id": proposal_id, "voter_id": voter_id, "vote_type": vote_type,
+        "voting_power": power, "reason": reason, "created_at": created_at
+    }
+
+
+def make_aggregator(**kwargs) -> VoteSentimentAggregator:
+    return VoteSentimentAggregator(SentimentAnalyzer(), **kwargs)
+
+
+def test_revote_replaces_earlier_vote():
+    aggregator = make_aggregator()
+    aggregator.ingest([vote("a", "a benefit plan", power=3), vote("b", "a scam", power=1, vote_type="Against")], use_model=False)
+    assert aggregator.current(1)["score"] == 50.0
+
+    aggregator.ingest([vote("a", "a scam", power=3, vote_type="Against")], use_model=False)
+    current = aggregator.current(1)
+
+    assert current["vote_count"] == 2
+    assert current["total_voting_power"] == 4.0
+    assert current["score"] == -100.0
+    assert current["voting_power_by_type"] == {"Against": 4.0}
+    assert [b["vote_count"] for b in aggregator.time_series(1)] == [2]
+
+
+def test_time_series_keeps_newest_buckets():
+    aggregator = make_aggregator(bucket_seconds=60, max_buckets=3)
+    aggregator.ingest([vote(str(i), "a benefit plan", created_at=i * 60) for i in range(5)], use_model=False)
+
+    series = aggregator.time_series(1)
+    assert [b["bucket_start"] for b in series] == [120, 180, 240]
+    # Trimming only shortens the series; the running aggregate keeps every vote
+    assert aggregator.current(1)["vote_count"] == 5
+
+    # Replacing a vote whose bucket was trimmed must not resurrect that bucket
+    aggregator.ingest([vote("0", "a scam", vote_type="Against", created_at=240)], use_model=False)
+    assert [b["bucket_start"] for b in aggregator.time_series(1)] == [120, 180, 240]
+    assert aggregator.current(1)["vote_count"] == 5
+
+
+def test_reads_during_concurrent_ingest():
+    aggregator = make_aggregator()
+    errors = []
+    done = threading.Event()
+
+    def writer(offset):
+        for i in range(200):
+            aggregator.ingest([vote(f"{offset}-{i}", "a benefit plan", vote_type=f"type-{i % 50}")], use_model=False)
+
+    def reader():
+        while not done.is_set():
+            try:
+                aggregator.current(1)
+                aggregator.current_score(1)
+            except Exception as e:
+                errors.append(e)
+
+    readers = [threading.Thread(target=reader) for _ in range(2)]
+    writers = [threading.Thread(target=writer, args=(n,)) for n in range(2)]
+    for thread in readers + writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    done.set()
+    for thread in readers:
+        thread.join()
+
+    assert errors == []
+    assert aggregator.current(1)["vote_count"] == 400